@@ -0,0 +1,63 @@
+"""
+Compares startup cost of the loose-file loaders against assets.pack.
+
+Each mode runs in a fresh interpreter so peak RSS is not shared between them:
+  loose      - decode every file in every asset folder (the old eager loaders)
+  pack-open  - open and index the pack only (what the launcher does at startup)
+  pack-all   - open the pack and build a Sound for every clip
+
+Run build_audio_pack.py first.
+"""
+import os
+import sys
+import time
+import json
+import resource
+import subprocess
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+MODES = ["loose", "pack-open", "pack-all"]
+
+def run_child(mode):
+    import pygame
+    from engine.audio_pack import ASSET_GROUPS, AUDIO_EXTENSIONS, MIXER_FORMAT, AudioPack, DEFAULT_PACK_PATH
+    pygame.mixer.init(*MIXER_FORMAT)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sounds = []
+    start = time.perf_counter()
+    if mode == "loose":
+        for folder in ASSET_GROUPS.values():
+            folder_path = os.path.join(ROOT_DIR, folder)
+            for filename in os.listdir(folder_path):
+                if filename.endswith(AUDIO_EXTENSIONS):
+                    sounds.append(pygame.mixer.Sound(os.path.join(folder_path, filename)))
+    else:
+        pack = AudioPack(DEFAULT_PACK_PATH)
+        if mode == "pack-all":
+            sounds = [pack.sound(name) for name in pack.index]
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"mode": mode, "clips": len(sounds), "seconds": elapsed,
+                      "rss_kb": peak_rss, "rss_delta_kb": peak_rss - base_rss}))
+
+def main():
+    from engine.audio_pack import DEFAULT_PACK_PATH
+    if not os.path.exists(DEFAULT_PACK_PATH):
+        print("assets.pack not found. Please run build_audio_pack.py first.")
+        return
+    print(f"{'mode':<10} {'clips':>6} {'time (ms)':>10} {'peak RSS (MB)':>14} {'RSS delta (MB)':>15}")
+    for mode in MODES:
+        out = subprocess.run([sys.executable, __file__, "--child", mode],
+                             capture_output=True, text=True, check=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        print(f"{mode:<10} {result['clips']:>6} {result['seconds'] * 1000:>10.1f} "
+              f"{result['rss_kb'] / 1024:>14.1f} {result['rss_delta_kb'] / 1024:>15.1f}")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        run_child(sys.argv[2])
+    else:
+        main()
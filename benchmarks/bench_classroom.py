@@ -0,0 +1,149 @@
+"""
+Load test for classroom mode: N simulated players, each streaming recorded
+answers to a local ClassroomServer in real time over its own socket.
+
+Usage:
+  python benchmarks/bench_classroom.py --audio DIR [--sessions 1,8,32] [--workers N] [--output FILE]
+
+DIR holds level0.wav ... level14.wav (16 kHz mono 16-bit), the same
+recordings bench_sessions.py uses. Every player's microphone streams
+continuously: it waits for a level's prompt, plays that level's recording,
+sends silence until the answer comes back, then VOICE_LINE_SECONDS more of
+silence while the front end would be speaking the result and next prompt.
+
+Reported per session count:
+  response_ms        - end of a recorded answer to its answer event (negative
+                       when a partial result decided before the recording ended)
+  queue_ms           - audio waiting for a free worker before decoding starts
+  sessions_per_core  - seconds of audio decoded per CPU-second: how many
+                       real-time players one core keeps up with
+"""
+import os
+import sys
+import json
+import time
+import wave
+import socket
+import argparse
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from game2.classroom import BLOCK_BYTES, ClassroomEngine, ClassroomServer
+from game2.levels import load_levels
+from game2.model_cache import SAMPLE_RATE
+from bench_sessions import git_revision, percentiles
+
+BLOCK_SECONDS = BLOCK_BYTES / (SAMPLE_RATE * 2)
+ANSWER_TIMEOUT = 10.0
+VOICE_LINE_SECONDS = 1.5
+
+def load_recordings(audio_dir):
+    recordings = []
+    for index in range(len(load_levels())):
+        with wave.open(os.path.join(audio_dir, f"level{index}.wav"), "rb") as wav:
+            if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError(f"level{index}.wav must be 16 kHz mono 16-bit")
+            recordings.append(wav.readframes(wav.getnframes()))
+    return recordings
+
+class Player:
+    """One simulated student: streams each level's answer and times the reply."""
+    def __init__(self, port, recordings):
+        self.sock = socket.create_connection(("127.0.0.1", port))
+        self.recordings = recordings
+        self.events = {}
+        self.arrived = threading.Condition()
+        self.response_times = []
+        self.timeouts = 0
+
+    def _read_events(self):
+        for line in self.sock.makefile("r", encoding="utf-8"):
+            event = json.loads(line)
+            with self.arrived:
+                self.events[(event["event"], event.get("level"))] = time.perf_counter()
+                self.arrived.notify_all()
+
+    def _wait_for(self, key, timeout):
+        with self.arrived:
+            return self.arrived.wait_for(lambda: key in self.events, timeout)
+
+    def _stream(self, pcm, until=None, limit=None):
+        """Sends `pcm` in real time, then silence until `until()` or `limit` seconds."""
+        next_block = time.perf_counter()
+        blocks = [pcm[i:i + BLOCK_BYTES] for i in range(0, len(pcm), BLOCK_BYTES)]
+        silence = bytes(BLOCK_BYTES)
+        deadline = None
+        while True:
+            if blocks:
+                self.sock.sendall(blocks.pop(0))
+            else:
+                if deadline is None:
+                    deadline = time.perf_counter() + limit
+                if until() or time.perf_counter() > deadline:
+                    return
+                self.sock.sendall(silence)
+            next_block += BLOCK_SECONDS
+            time.sleep(max(0.0, next_block - time.perf_counter()))
+
+    def run(self):
+        threading.Thread(target=self._read_events, daemon=True).start()
+        try:
+            for level, pcm in enumerate(self.recordings):
+                if not self._wait_for(("prompt", level), ANSWER_TIMEOUT):
+                    break
+                key = ("answer", level)
+                sent_at = time.perf_counter() + len(pcm) / (SAMPLE_RATE * 2)
+                self._stream(pcm, until=lambda: key in self.events, limit=ANSWER_TIMEOUT)
+                if key not in self.events:
+                    self.timeouts += 1
+                    break
+                self.response_times.append(self.events[key] - sent_at)
+                self._stream(b"", until=lambda: False, limit=VOICE_LINE_SECONDS)
+        finally:
+            self.sock.close()
+
+def run_load(sessions, workers, recordings):
+    engine = ClassroomEngine(workers).start()
+    server = ClassroomServer(engine, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    players = [Player(server.server_address[1], recordings) for _ in range(sessions)]
+    start = time.perf_counter()
+    threads = [threading.Thread(target=player.run) for player in players]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    engine.stop()
+    stats = engine.stats()
+    responses = [t for player in players for t in player.response_times]
+    return {"sessions": sessions, "workers": engine.workers, "wall_seconds": wall,
+            "answers": len(responses), "timeouts": sum(player.timeouts for player in players),
+            "response_ms": percentiles(responses), "queue_ms": percentiles(engine.queue_delays),
+            "audio_seconds": stats["audio_seconds"], "decode_cpu_seconds": stats["decode_cpu_seconds"],
+            "sessions_per_core": stats["sessions_per_core"]}
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Load-test classroom mode over local sockets.")
+    parser.add_argument("--audio", required=True, help="Folder with level0.wav ... level14.wav")
+    parser.add_argument("--sessions", default="1,8,32", help="Comma-separated session counts")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default="bench_classroom.json")
+    args = parser.parse_args(argv)
+    recordings = load_recordings(args.audio)
+    results = []
+    for sessions in [int(count) for count in args.sessions.split(",")]:
+        print(f"--- {sessions} sessions on {args.workers} workers ---")
+        results.append(run_load(sessions, args.workers, recordings))
+        print(json.dumps(results[-1], indent=2))
+    with open(args.output, "w") as f:
+        json.dump({"revision": git_revision(), "timestamp": time.time(), "cpu_count": os.cpu_count(),
+                   "runs": results}, f, indent=2)
+    print(f"Results written to '{args.output}'")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,108 @@
+"""
+Measures open-vocabulary, final-result decoding (the old listen() loop) against
+per-level grammar decoding with early commit on partial results.
+
+Usage: python benchmarks/bench_grammar_decoding.py LEVEL FILE.wav [FILE.wav ...]
+
+Files must be 16 kHz mono 16-bit recordings of someone answering LEVEL
+(0-based). For each file and mode it reports the decode CPU time and how far
+into the audio the answer was decided; the difference between the two modes
+is the response latency saved.
+
+It then checks that AnswerDecoder can move on to the next level straight after
+deciding an answer, while the recognizer is still decoding the rest of the
+utterance (libvosk aborts the process if the grammar is changed in that state).
+"""
+import os
+import sys
+import time
+import json
+import wave
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from vosk import Model, KaldiRecognizer, SetLogLevel
+from game2.grammar import UNKNOWN_WORD, AnswerDecoder, decide, decide_partial, level_grammar, level_options
+from game2.model_cache import MODEL_PATH, SAMPLE_RATE
+from game2.levels import load_levels
+
+BLOCK_SAMPLES = 1600 # 100 ms
+
+def read_blocks(path):
+    with wave.open(path, "rb") as wav:
+        if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise ValueError(f"{path} must be 16 kHz mono 16-bit")
+        frames = wav.readframes(wav.getnframes())
+    step = BLOCK_SAMPLES * 2
+    return [frames[i:i + step] for i in range(0, len(frames), step)]
+
+def run_open_vocabulary(model, blocks, options):
+    recognizer = KaldiRecognizer(model, SAMPLE_RATE)
+    for i, block in enumerate(blocks):
+        if recognizer.AcceptWaveform(block):
+            text = json.loads(recognizer.Result()).get("text", "")
+            if text:
+                return decide(text, options), i + 1
+    return decide(json.loads(recognizer.FinalResult()).get("text", ""), options), len(blocks)
+
+def run_grammar_partial(model, blocks, options, grammar):
+    recognizer = KaldiRecognizer(model, SAMPLE_RATE, grammar)
+    for i, block in enumerate(blocks):
+        if recognizer.AcceptWaveform(block):
+            text = json.loads(recognizer.Result()).get("text", "").replace(UNKNOWN_WORD, "").strip()
+            if text:
+                return decide(text, options), i + 1
+            continue
+        option = decide_partial(json.loads(recognizer.PartialResult()).get("partial", ""), options)
+        if option:
+            return option, i + 1
+    return decide(json.loads(recognizer.FinalResult()).get("text", ""), options), len(blocks)
+
+def check_level_change(model, blocks, levels, level_index):
+    """Decides an answer, feeds one more block as the game does, then changes level. Returns True if an answer was decided."""
+    decoder = AnswerDecoder(KaldiRecognizer(model, SAMPLE_RATE), levels, vad=False)
+    decoder.set_level(level_index)
+    for i, block in enumerate(blocks):
+        if decoder.accept(block) is not None:
+            decoder.accept(blocks[min(i + 1, len(blocks) - 1)], listening=False)
+            decoder.set_level((level_index + 1) % len(levels))
+            return True
+    return False
+
+def main(level_index, paths):
+    SetLogLevel(-1)
+    levels = load_levels()
+    level = levels[int(level_index)]
+    options = level_options(level)
+    grammar = level_grammar(level)
+    model = Model(MODEL_PATH)
+    block_seconds = BLOCK_SAMPLES / SAMPLE_RATE
+    totals = {"open": [0.0, 0.0], "grammar": [0.0, 0.0]}
+    print(f"{'file':<30} {'mode':<8} {'answer':<14} {'decided at (s)':>15} {'cpu (ms)':>9}")
+    for path in paths:
+        blocks = read_blocks(path)
+        for mode, run in (("open", lambda: run_open_vocabulary(model, blocks, options)),
+                          ("grammar", lambda: run_grammar_partial(model, blocks, options, grammar))):
+            start = time.process_time()
+            answer, decided_block = run()
+            cpu = time.process_time() - start
+            decided_at = decided_block * block_seconds
+            totals[mode][0] += decided_at
+            totals[mode][1] += cpu
+            print(f"{os.path.basename(path):<30} {mode:<8} {str(answer):<14} {decided_at:>15.2f} {cpu * 1000:>9.1f}")
+    count = len(paths)
+    saved = (totals["open"][0] - totals["grammar"][0]) / count
+    print(f"\nMean decision point: open {totals['open'][0] / count:.2f}s, grammar {totals['grammar'][0] / count:.2f}s "
+          f"({saved * 1000:.0f} ms earlier)")
+    print(f"Mean decode CPU: open {totals['open'][1] / count * 1000:.1f} ms, "
+          f"grammar {totals['grammar'][1] / count * 1000:.1f} ms")
+
+    decided = [check_level_change(model, read_blocks(path), levels, int(level_index)) for path in paths]
+    print(f"Level change right after an answer: ok ({sum(decided)} of {count} files decided an answer first)")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2:])
@@ -0,0 +1,102 @@
+"""
+Compares loading Daily Routine levels eagerly from their JSON-lines source
+against the indexed level pack, on synthetic packs of up to 10,000 levels.
+
+Usage: python benchmarks/bench_level_pack.py [LEVEL_COUNT ...]
+
+For each size it reports:
+  eager load       - parse every level into a list up front (the old approach)
+  pack open        - map the pack and read its header
+  random access    - 1,000 levels fetched by random index
+  stream all       - iterate the whole pack once
+  theme open       - first lookup of one theme
+with wall time and peak Python heap (tracemalloc). Pack pages are mapped from
+the file rather than allocated, so they do not appear in the heap figures.
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from game2.level_pack import LevelPack, write_level_pack
+
+DEFAULT_SIZES = [100, 1000, 10000]
+THEMES = ["morning", "school", "evening", "weekend", "holiday"]
+RANDOM_READS = 1000
+
+def synthetic_levels(count):
+    """Levels shaped like the real ones, grouped into contiguous themes."""
+    per_theme = max(1, count // len(THEMES))
+    for number in range(count):
+        good, bad = f"answer {number}", f"distractor {number}"
+        yield {"theme": THEMES[min(number // per_theme, len(THEMES) - 1)],
+               "prompt": f"Say '{good}' or '{bad}'", "answers": [good, bad], "correct": good,
+               "success": f"Well done on level {number}!", "fail": f"Not {bad} now. Say {good}.",
+               "audio": {category: f"voice_lines/{category}_level{number}" for category in ("prompt", "success", "fail")}}
+
+def measure(action):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed * 1000, peak / 1024
+
+def load_eager(source):
+    with open(source, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def read_random(pack, numbers):
+    for number in numbers:
+        pack[number]
+
+def stream_all(pack):
+    count = 0
+    for level in pack:
+        count += len(level["prompt"])
+    return count
+
+def run_size(folder, count):
+    source = os.path.join(folder, f"levels_{count}.jsonl")
+    path = os.path.join(folder, f"levels_{count}.levels")
+    with open(source, "w", encoding="utf-8") as f:
+        for level in synthetic_levels(count):
+            f.write(json.dumps(level) + "\n")
+    write_level_pack(path, synthetic_levels(count))
+    numbers = [random.randrange(count) for _ in range(RANDOM_READS)]
+
+    rows = []
+    levels, ms, kb = measure(lambda: load_eager(source))
+    rows.append(("eager load", ms, kb))
+    del levels
+    pack, ms, kb = measure(lambda: LevelPack(path))
+    rows.append(("pack open", ms, kb))
+    _, ms, kb = measure(lambda: read_random(pack, numbers))
+    rows.append((f"random access x{RANDOM_READS}", ms, kb))
+    _, ms, kb = measure(lambda: stream_all(pack))
+    rows.append(("stream all", ms, kb))
+    _, ms, kb = measure(lambda: len(pack.theme("school")))
+    rows.append(("theme open", ms, kb))
+    pack.close()
+
+    print(f"\n--- {count} levels: source {os.path.getsize(source) / 1024:.0f} KB, "
+          f"pack {os.path.getsize(path) / 1024:.0f} KB ---")
+    print(f"{'step':<22} {'time (ms)':>10} {'peak heap (KB)':>15}")
+    for name, ms, kb in rows:
+        print(f"{name:<22} {ms:>10.2f} {kb:>15.1f}")
+
+def main(sizes):
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as folder:
+        for count in sizes:
+            run_size(folder, count)
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
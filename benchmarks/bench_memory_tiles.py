@@ -0,0 +1,83 @@
+"""
+Measures Memory Tiles cost as the board grows, headless.
+
+Usage: python benchmarks/bench_memory_tiles.py [SIZE ...]   (default: 4 6 8 10 12)
+
+For each SIZE x SIZE board it reports:
+  setup_ms     - building the game: key layout, board and sound pool index
+  full_draw_ms - the first draw of the whole board
+  frame_ms     - a steady-state frame (draw_board with nothing changed)
+  move_ms      - one reveal-reveal-resolve move, excluding the first play of each pair's sound
+  sound_ms     - loading (and, past the recordings, pitch-shifting) a pair's sound the first time
+  state_bytes  - size of the tile state arrays
+  loaded       - recordings in memory / pair sounds built when every tile has been revealed
+
+Boards other than 4x4 exist for this benchmark only; the launcher never
+builds them. Their scores and key names have no speech clips, so the
+"No speech for phrase" warnings they print are expected.
+"""
+import os
+import sys
+import time
+import random
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR)
+
+import pygame
+
+DEFAULT_SIZES = [4, 6, 8, 10, 12]
+FRAMES = 300
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, (time.perf_counter() - start) * 1000
+
+def run_size(screen, speech, size):
+    from memory_tiles.memory_tiles import MemoryGame
+    game, setup_ms = timed(lambda: MemoryGame(screen, speech, rows=size, cols=size))
+    board = game.board
+    _, full_draw_ms = timed(game.draw_board)
+    frame_ms = statistics.median(timed(game.draw_board)[1] for _ in range(FRAMES))
+
+    sound_ms = [timed(lambda pair=pair: game.sound_pool.sound(pair))[1] for pair in range(game.pair_count)]
+    # Random moves until the board is solved; matches happen as they would in play
+    moves = []
+    rng = random.Random(0)
+    while not board.complete:
+        hidden = [i for i in range(board.size) if board.state[i] != 2]
+        first, second = rng.sample(hidden, 2)
+        def move():
+            game.process_selection(first)
+            game.process_selection(second)
+            game.resolve_match()
+            game.draw_board()
+        moves.append(timed(move)[1])
+        game.stop_all_sounds()
+    return {"size": f"{size}x{size}", "setup_ms": setup_ms, "full_draw_ms": full_draw_ms,
+            "frame_ms": frame_ms, "move_ms": statistics.median(moves), "moves": len(moves),
+            "sound_ms": statistics.median(sound_ms),
+            "state_bytes": len(board.pairs) * board.pairs.itemsize + len(board.state),
+            "loaded": "%d/%d" % game.sound_pool.loaded()}
+
+def main(sizes):
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    import main as launcher
+    speech = launcher.load_speech_files()
+    rows = [run_size(screen, speech, size) for size in sizes]
+    columns = ["size", "setup_ms", "full_draw_ms", "frame_ms", "move_ms", "moves", "sound_ms", "state_bytes", "loaded"]
+    print(" ".join(f"{name:>12}" for name in columns))
+    for row in rows:
+        print(" ".join(f"{row[name]:>12.4f}" if isinstance(row[name], float) else f"{row[name]:>12}"
+                       for name in columns))
+    pygame.quit()
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,156 @@
+"""
+Compares the shipped Vosk models on a labelled corpus (see game2/corpus.py),
+with open-vocabulary and per-level grammar decoding.
+
+Usage: python benchmarks/bench_models.py [--corpus DIR] [--models NAME ...]
+                                         [--processes N] [--threshold ACC] [--save]
+
+The corpus is replayed faster than real time, spread over N processes (each
+loads the model once). Both modes commit the same way the game does: on the
+first partial or final result that names exactly one answer. For every model
+and mode it reports:
+  accuracy   - recordings decided as their label ("" labels must decide nothing)
+  rtf        - decode CPU seconds per second of audio (below 1 is faster than real time)
+  speedup    - seconds of audio replayed per wall-clock second, over all processes
+  commit_s   - mean seconds into a recording at which the answer was committed
+  load_s     - model load time
+  peak_mb    - largest worker resident set size (Unix only)
+The fastest model whose grammar-mode accuracy reaches the threshold is
+suggested; --save writes it to game2/model_choice.json, which the game's
+model cache reads at startup.
+"""
+import os
+import sys
+import json
+import time
+import wave
+import argparse
+import multiprocessing
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from game2.corpus import DEFAULT_CORPUS_DIR, load_corpus
+from game2.model_cache import DEFAULT_MODEL, GAME_DIR, MODEL_CHOICE_PATH, SAMPLE_RATE
+
+DEFAULT_MODELS = [DEFAULT_MODEL, "model-1"]
+MODES = ["open", "grammar"]
+BLOCK_BYTES = SAMPLE_RATE * 2 // 10 # 100 ms per AcceptWaveform call
+DEFAULT_THRESHOLD = 0.9
+
+# --- Worker process side ---
+_model = None
+_load_seconds = 0.0
+_load_error = None
+
+def load_model(path):
+    # A pool initializer that raises is retried forever, so failures are kept for decode() to report
+    global _model, _load_seconds, _load_error
+    start = time.perf_counter()
+    try:
+        from vosk import Model, SetLogLevel
+        SetLogLevel(-1)
+        _model = Model(path)
+    except Exception as e:
+        _load_error = e
+    _load_seconds = time.perf_counter() - start
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def decode(job):
+    """Replays one recording. Returns its result as a dict."""
+    if _load_error is not None:
+        raise _load_error
+    from vosk import KaldiRecognizer
+    from game2.grammar import AnswerDecoder, decide
+    from game2.levels import load_levels
+    entry, mode = job
+    levels = load_levels()
+    with wave.open(entry["path"], "rb") as wav:
+        pcm = wav.readframes(wav.getnframes())
+    start = time.process_time()
+    recognizer = KaldiRecognizer(_model, SAMPLE_RATE)
+    decoder = AnswerDecoder(recognizer, levels)
+    decoder.set_level(entry["level"], grammar=mode == "grammar")
+    answer, committed_at = None, None
+    for offset in range(0, len(pcm), BLOCK_BYTES):
+        result = decoder.accept(pcm[offset:offset + BLOCK_BYTES])
+        if result is not None:
+            answer = decide(result[0], decoder.options)
+            committed_at = min(offset + BLOCK_BYTES, len(pcm)) / (SAMPLE_RATE * 2)
+            break
+    if committed_at is None:
+        answer = decide(json.loads(recognizer.FinalResult()).get("text", ""), decoder.options)
+    return {"correct": (answer or "") == entry["answer"], "committed_at": committed_at,
+            "audio_seconds": len(pcm) / (SAMPLE_RATE * 2), "cpu_seconds": time.process_time() - start,
+            "load_seconds": _load_seconds, "peak_mb": peak_rss_mb()}
+
+# --- Comparison ---
+def compare_model(name, entries, processes):
+    """Replays the corpus in each mode on one model. Returns a row per mode."""
+    path = os.path.join(GAME_DIR, name)
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    with context.Pool(processes, initializer=load_model, initargs=(path,)) as pool:
+        for mode in MODES:
+            start = time.perf_counter()
+            results = pool.map(decode, [(entry, mode) for entry in entries], chunksize=1)
+            wall = time.perf_counter() - start
+            audio = sum(r["audio_seconds"] for r in results)
+            commits = [r["committed_at"] for r in results if r["committed_at"] is not None]
+            peaks = [r["peak_mb"] for r in results if r["peak_mb"] is not None]
+            rows.append({"model": name, "mode": mode,
+                         "accuracy": sum(r["correct"] for r in results) / len(results),
+                         "rtf": sum(r["cpu_seconds"] for r in results) / audio,
+                         "speedup": audio / wall,
+                         "commit_s": sum(commits) / len(commits) if commits else None,
+                         "load_s": max(r["load_seconds"] for r in results),
+                         "peak_mb": max(peaks) if peaks else None})
+    return rows
+
+def choose(rows, threshold):
+    """The fastest grammar-mode row with accuracy >= threshold, or None."""
+    passing = [row for row in rows if row["mode"] == "grammar" and row["accuracy"] >= threshold]
+    return min(passing, key=lambda row: row["rtf"]) if passing else None
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Compare speech models on a labelled corpus.")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--models", nargs="+", default=DEFAULT_MODELS)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="write the suggested model to model_choice.json")
+    args = parser.parse_args(argv)
+    entries = load_corpus(args.corpus)
+    if not entries:
+        print(f"No recordings in '{args.corpus}'. Add some with game2/corpus.py first.")
+        sys.exit(1)
+    print(f"Replaying {len(entries)} recordings on {args.processes} processes")
+    rows = []
+    for name in args.models:
+        try:
+            rows += compare_model(name, entries, args.processes)
+        except Exception as e:
+            print(f"  - Could not run model '{name}': {e}")
+    columns = ["model", "mode", "accuracy", "rtf", "speedup", "commit_s", "load_s", "peak_mb"]
+    print(" ".join(f"{name:>10}" for name in columns))
+    for row in rows:
+        print(" ".join(f"{row[name]:>10.3f}" if isinstance(row[name], float) else f"{str(row[name]):>10}"
+                       for name in columns))
+    best = choose(rows, args.threshold)
+    if best is None:
+        print(f"\nNo model reached {args.threshold:.0%} accuracy with grammar decoding")
+        return
+    print(f"\nSuggested model: {best['model']} ({best['accuracy']:.0%} accurate, rtf {best['rtf']:.3f})")
+    if args.save:
+        with open(MODEL_CHOICE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(best, threshold=args.threshold), f, indent=2)
+        print(f"Saved to '{os.path.relpath(MODEL_CHOICE_PATH, ROOT_DIR)}'")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,328 @@
+"""
+Headless scripted-session benchmark for the launcher and both games.
+
+Every scenario runs in its own interpreter under the SDL dummy video and audio
+drivers, with scripted key presses and (for Daily Routine Adventure)
+pre-recorded 16 kHz PCM fed through a stand-in for `sounddevice`, so no
+keyboard, screen, microphone or sound card is needed.
+
+Reported per scenario:
+  frame_ms                 - per-frame work time (Clock.tick to Clock.tick, sleep excluded)
+  key_to_sound_ms          - injected key press to the next clip starting on any channel
+  recognition_to_response_ms - answer committed by the recognizer to its voice line starting
+  utterance_to_response_ms   - last sample of the spoken answer delivered to its voice line starting
+  voice_lines              - Daily Routine voice-line cache hit rate and decode time saved per playback
+  recognition_gate         - audio the voice activity gate kept from the recognizer and the decode CPU saved
+  scene_switch_ms          - launcher: menu to game and back, until the new scene's first frame is drawn
+  peak_rss_mb
+
+Usage:
+  python benchmarks/bench_sessions.py [--output FILE] [--audio DIR] [--recognition MODE] [SCENARIO ...]
+
+--audio points at recordings named level0.wav ... level14.wav (16 kHz mono
+16-bit) answering each Daily Routine level; without it, or without vosk and
+its model, that scenario is reported as skipped.
+
+--recognition thread|process picks where Daily Routine decodes speech
+(BLINDGAME_RECOGNITION). Compare frame_ms p95/p99 between the two runs to see
+the render-loop jitter caused by in-process decoding while answers are spoken.
+"""
+import os
+import sys
+import json
+import time
+import wave
+import types
+import resource
+import threading
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS = ["launcher", "memory_tiles", "daily_routine"]
+SAMPLE_RATE = 16000
+
+# --- Measurements (filled in by the hooks below) ---
+frame_times = []
+key_times = []
+sound_starts = []
+commit_times = []
+utterance_ends = []
+# Scenario-specific figures added to the result as they are
+extra_results = {}
+
+def percentiles(values):
+    if not values:
+        return None
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {"count": len(ordered), "p50": pick(0.50) * 1000, "p95": pick(0.95) * 1000,
+            "p99": pick(0.99) * 1000, "max": ordered[-1] * 1000}
+
+def latencies(starts, ends):
+    """For each start time, the delay until the first end time after it."""
+    result = []
+    for start in starts:
+        later = [end for end in ends if end >= start]
+        if later:
+            result.append(min(later) - start)
+    return result
+
+# --- Fake microphone ---
+class FakeMicrophone:
+    """Delivers queued PCM (silence when idle) to the stream callback in real time."""
+    def __init__(self):
+        self.pending = bytearray()
+        self.lock = threading.Lock()
+
+    def say(self, pcm):
+        with self.lock:
+            self.pending.extend(pcm)
+
+    @property
+    def idle(self):
+        return not self.pending
+
+    def read(self, nbytes):
+        with self.lock:
+            chunk = bytes(self.pending[:nbytes])
+            del self.pending[:nbytes]
+            if chunk and not self.pending:
+                utterance_ends.append(time.perf_counter())
+        return chunk + b"\0" * (nbytes - len(chunk))
+
+microphone = FakeMicrophone()
+
+class FakeRawInputStream:
+    def __init__(self, samplerate, blocksize, dtype, channels, callback):
+        self.blocksize = blocksize
+        self.block_seconds = blocksize / samplerate
+        self.callback = callback
+        self.active = False
+
+    def start(self):
+        self.active = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        next_block = time.perf_counter()
+        while self.active:
+            self.callback(microphone.read(self.blocksize * 2), self.blocksize, None, None)
+            next_block += self.block_seconds
+            time.sleep(max(0.0, next_block - time.perf_counter()))
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def install_hooks():
+    fake_sd = types.ModuleType("sounddevice")
+    fake_sd.RawInputStream = FakeRawInputStream
+    sys.modules["sounddevice"] = fake_sd
+
+    import pygame
+    real_clock = pygame.time.Clock
+
+    class TimedClock:
+        def __init__(self):
+            self.clock = real_clock()
+            self.frame_start = None
+
+        def tick(self, framerate=0):
+            if self.frame_start is not None:
+                frame_times.append(time.perf_counter() - self.frame_start)
+            result = self.clock.tick(framerate)
+            self.frame_start = time.perf_counter()
+            return result
+
+        def __getattr__(self, name):
+            return getattr(self.clock, name)
+
+    pygame.time.Clock = TimedClock
+
+    from engine.playback import ChannelPlayer
+    def timed(method):
+        def wrapper(self, *args, **kwargs):
+            before = self.channel.get_sound()
+            result = method(self, *args, **kwargs)
+            after = self.channel.get_sound()
+            if after is not None and after is not before:
+                sound_starts.append(time.perf_counter())
+            return result
+        return wrapper
+    ChannelPlayer.play = timed(ChannelPlayer.play)
+    ChannelPlayer._feed = timed(ChannelPlayer._feed)
+
+def press(key):
+    import pygame
+    key_times.append(time.perf_counter())
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+def run_script(steps):
+    """Runs (delay_seconds, key) steps on a background thread."""
+    def worker():
+        for delay, key in steps:
+            time.sleep(delay)
+            press(key)
+    threading.Thread(target=worker, daemon=True).start()
+
+def init_display():
+    import pygame
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.init()
+    return pygame.display.set_mode((800, 600))
+
+# --- Scenarios ---
+def scenario_launcher(options):
+    import pygame
+    import main
+    real_draw = main.draw_menu
+    def timed_draw(*args):
+        start = time.perf_counter()
+        real_draw(*args)
+        frame_times.append(time.perf_counter() - start)
+    main.draw_menu = timed_draw
+    from engine.scene import Engine
+    engines = []
+    real_run = Engine.run
+    def recorded_run(self, home):
+        engines.append(self)
+        real_run(self, home)
+    Engine.run = recorded_run
+    # Let the welcome announcement play, visit Memory Tiles, try the speech game twice, then quit
+    run_script([(3.0, pygame.K_1), (3.0, pygame.K_ESCAPE), (2.0, pygame.K_2), (2.0, pygame.K_2),
+                (2.0, pygame.K_ESCAPE), (2.0, pygame.K_ESCAPE)])
+    main.main()
+    if engines:
+        extra_results["scene_switch_ms"] = [[name, round(ms, 2)] for name, ms in engines[0].switch_ms]
+
+def scenario_memory_tiles(options):
+    import pygame
+    import main
+    screen = init_display()
+    from memory_tiles.memory_tiles import MemoryGame
+    game = MemoryGame(screen, main.load_speech_files())
+    keys = [pygame.K_1, pygame.K_2, pygame.K_q, pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_z, pygame.K_x]
+    # Leave room for the intro, then for each key name, tile sound and match check
+    run_script([(12.0, keys[0])] + [(5.0, key) for key in keys[1:]] + [(5.0, pygame.K_i), (3.0, pygame.K_ESCAPE)])
+    game.run()
+
+def scenario_daily_routine(options):
+    audio_dir = options.get("audio")
+    if not audio_dir:
+        return "no --audio recordings given"
+    try:
+        import vosk
+    except ImportError:
+        return "vosk is not installed"
+    import pygame
+    from game2 import model_cache, recognition_worker
+    try:
+        if recognition_worker.ENABLED:
+            recognition_worker.get_worker()
+        else:
+            model_cache.get_model()
+    except Exception as e:
+        return f"speech model unavailable: {e}"
+    screen = init_display()
+    from game2.daily_routine_game import DailyRoutineGame
+    game = DailyRoutineGame(screen)
+    real_commit = game.commit_answer
+    def timed_commit(*args, **kwargs):
+        commit_times.append(time.perf_counter())
+        real_commit(*args, **kwargs)
+    game.commit_answer = timed_commit
+
+    def speak_answers():
+        fed = set()
+        deadline = time.time() + 300
+        while game.running and time.time() < deadline:
+            level = game.current_level
+            # Answer once the prompt has finished: capture drops what it hears while the game speaks
+            prompting = game.capture.playing or game.audio.busy("prompts")
+            if game.level_done is None and not prompting and level not in fed and microphone.idle:
+                path = os.path.join(audio_dir, f"level{level}.wav")
+                if not os.path.exists(path):
+                    break
+                with wave.open(path, "rb") as wav:
+                    microphone.say(wav.readframes(wav.getnframes()))
+                fed.add(level)
+            time.sleep(0.05)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+    threading.Thread(target=speak_answers, daemon=True).start()
+    game.run()
+    extra_results["voice_lines"] = game.voice_lines.stats()
+    extra_results["recognition_gate"] = game.recognition_stats()
+
+def run_child(name, options):
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    sys.path.insert(0, ROOT_DIR)
+    os.chdir(ROOT_DIR)
+    install_hooks()
+    start = time.perf_counter()
+    skipped = globals()[f"scenario_{name}"](options)
+    result = {"scenario": name, "seconds": time.perf_counter() - start}
+    if skipped:
+        result["skipped"] = skipped
+    else:
+        result.update({
+            "frame_ms": percentiles(frame_times),
+            "key_to_sound_ms": percentiles(latencies(key_times, sound_starts)),
+            "recognition_to_response_ms": percentiles(latencies(commit_times, sound_starts)),
+            "utterance_to_response_ms": percentiles(latencies(utterance_ends, sound_starts)),
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        })
+        result.update(extra_results)
+    print("RESULT " + json.dumps(result))
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv):
+    output = "bench_sessions.json"
+    options = {}
+    names = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--output":
+            output = next(args)
+        elif arg == "--audio":
+            options["audio"] = os.path.abspath(next(args))
+        elif arg == "--recognition":
+            os.environ["BLINDGAME_RECOGNITION"] = next(args)
+        else:
+            names.append(arg)
+    results = {}
+    for name in names or SCENARIOS:
+        print(f"--- Running scenario '{name}' ---")
+        proc = subprocess.run([sys.executable, __file__, "--child", name, json.dumps(options)],
+                              capture_output=True, text=True)
+        lines = [line for line in proc.stdout.splitlines() if line.startswith("RESULT ")]
+        if proc.returncode != 0 or not lines:
+            results[name] = {"scenario": name, "error": proc.stderr.strip().splitlines()[-1:] or ["no result"]}
+        else:
+            results[name] = json.loads(lines[-1][len("RESULT "):])
+        print(json.dumps(results[name], indent=2))
+    with open(output, "w") as f:
+        json.dump({"revision": git_revision(), "timestamp": time.time(),
+                   "recognition": os.environ.get("BLINDGAME_RECOGNITION", "thread"), "scenarios": results}, f, indent=2)
+    print(f"Results written to '{output}'")
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], json.loads(sys.argv[3]) if len(sys.argv) > 3 else {})
+    else:
+        main(sys.argv[1:])
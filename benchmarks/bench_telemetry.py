@@ -0,0 +1,72 @@
+"""
+Measures what the telemetry hooks cost, switched off and on.
+
+Usage: python benchmarks/bench_telemetry.py [CALLS]   (default: 200000)
+
+For each hook it reports nanoseconds per call:
+  baseline  - calling an empty function, the floor for any hook
+  disabled  - the hook with telemetry off (the default)
+  enabled   - the hook recording into its ring (written to a temporary file)
+and what one frame's worth of hooks (a frame timer, a queue depth sample and
+a key mark answered by a clip) adds to a 30 fps frame, as a percentage.
+"""
+import os
+import sys
+import time
+import tempfile
+
+os.environ.pop("BLINDGAME_TELEMETRY", None)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from engine import telemetry
+
+DEFAULT_CALLS = 200000
+FRAME_NS = 1e9 / 30
+
+def noop(*args):
+    pass
+
+def per_call_ns(action, calls):
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        action()
+    return (time.perf_counter_ns() - start) / calls
+
+def hooks():
+    frame = telemetry.FrameTimer("bench_frame_ms")
+    def frame_hooks():
+        frame.begin()
+        frame.end()
+    def mark_hooks():
+        telemetry.mark("key")
+        telemetry.since_mark("key", "bench_key_ms")
+    return {
+        "record": lambda: telemetry.record("bench_depth", 3),
+        "frame timer": frame_hooks,
+        "mark + since_mark": mark_hooks,
+        "timed_load": lambda: telemetry.timed_load("bench_load_ms", noop, None),
+    }
+
+def measure(calls):
+    baseline = per_call_ns(lambda: noop("bench_depth", 3), calls)
+    disabled = {name: per_call_ns(action, calls) for name, action in hooks().items()}
+    with tempfile.TemporaryDirectory() as folder:
+        recorder = telemetry.enable(os.path.join(folder, "telemetry.jsonl"))
+        enabled = {name: per_call_ns(action, calls) for name, action in hooks().items()}
+        recorder.close()
+        telemetry._recorder = None
+    return baseline, disabled, enabled
+
+def main(calls):
+    baseline, disabled, enabled = measure(calls)
+    print(f"{'hook':>20} {'baseline_ns':>12} {'disabled_ns':>12} {'enabled_ns':>12}")
+    for name in disabled:
+        print(f"{name:>20} {baseline:>12.1f} {disabled[name]:>12.1f} {enabled[name]:>12.1f}")
+    frame_hooks = ["frame timer", "record", "mark + since_mark"]
+    for label, costs in (("disabled", disabled), ("enabled", enabled)):
+        per_frame = sum(costs[name] for name in frame_hooks)
+        print(f"per 30 fps frame, {label}: {per_frame:.0f} ns ({per_frame / FRAME_NS * 100:.4f}% of the frame)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CALLS)
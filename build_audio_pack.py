@@ -0,0 +1,89 @@
+import os
+import sys
+import json
+import time
+
+# Decoding does not need a sound card, so allow building on headless machines
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+import pygame.sndarray
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from engine.audio_pack import ASSET_GROUPS, AUDIO_EXTENSIONS, DEFAULT_PACK_PATH, MIXER_FORMAT, ROOT_DIR, write_pack
+from engine.pcm import normalize_loudness, trim_silence
+
+def compile_clip(path, normalize):
+    """
+    Decodes one asset to the mixer's native format, trims its silence and
+    normalises its loudness. Returns (pcm_bytes, manifest_entry).
+    """
+    start = time.perf_counter()
+    sound = pygame.mixer.Sound(path)
+    decode_seconds = time.perf_counter() - start
+    samples = pygame.sndarray.array(sound)
+    frequency = pygame.mixer.get_init()[0]
+    entry = {"source": os.path.relpath(path, ROOT_DIR), "source_bytes": os.path.getsize(path),
+             "source_seconds": len(samples) / frequency}
+    if normalize:
+        trimmed = trim_silence(samples, frequency)
+        if len(trimmed):
+            samples = trimmed
+        samples, gain_db = normalize_loudness(samples)
+        entry["gain_db"] = round(gain_db, 2)
+    pcm = samples.tobytes()
+    start = time.perf_counter()
+    pygame.mixer.Sound(buffer=pcm)
+    raw_seconds = time.perf_counter() - start
+    entry.update({"seconds": len(samples) / frequency, "pcm_bytes": len(pcm),
+                  "decode_ms": round(decode_seconds * 1000, 3), "raw_load_ms": round(raw_seconds * 1000, 3)})
+    return pcm, entry
+
+def iter_clips(manifest, normalize):
+    """Compiles every asset. Yields (pack_name, pcm_bytes) and fills in `manifest`."""
+    for group, folder in ASSET_GROUPS.items():
+        folder_path = os.path.join(ROOT_DIR, folder)
+        if not os.path.isdir(folder_path):
+            print(f"Warning: '{folder}' directory not found, skipping.")
+            continue
+        for filename in sorted(os.listdir(folder_path)):
+            key, ext = os.path.splitext(filename)
+            if ext not in AUDIO_EXTENSIONS:
+                continue
+            try:
+                pcm, entry = compile_clip(os.path.join(folder_path, filename), normalize)
+            except pygame.error as e:
+                print(f"  - Error decoding '{folder}/{filename}': {e}")
+                continue
+            manifest[f"{group}/{key}"] = entry
+            yield f"{group}/{key}", pcm
+
+def print_report(manifest):
+    print(f"{'asset':<45} {'trimmed (s)':>12} {'gain (dB)':>10} {'decode (ms)':>12} {'raw (ms)':>9} {'saved (ms)':>11}")
+    saved_total = 0.0
+    for name, entry in sorted(manifest.items()):
+        saved = entry["decode_ms"] - entry["raw_load_ms"]
+        saved_total += saved
+        trimmed = entry["source_seconds"] - entry["seconds"]
+        print(f"{name:<45} {trimmed:>12.2f} {entry.get('gain_db', 0.0):>10.1f} "
+              f"{entry['decode_ms']:>12.2f} {entry['raw_load_ms']:>9.2f} {saved:>11.2f}")
+    print(f"Load time saved across {len(manifest)} assets: {saved_total:.1f} ms")
+
+def main(path=DEFAULT_PACK_PATH, normalize=True):
+    frequency, size, channels = MIXER_FORMAT
+    pygame.mixer.init(frequency, size, channels)
+    manifest = {}
+    start = time.perf_counter()
+    clips, blobs, total = write_pack(path, iter_clips(manifest, normalize), pygame.mixer.get_init())
+    elapsed = time.perf_counter() - start
+    manifest_path = os.path.splitext(path)[0] + ".manifest.json"
+    with open(manifest_path, "w") as f:
+        json.dump({"mixer_format": list(pygame.mixer.get_init()), "normalized": normalize, "assets": manifest},
+                  f, indent=2, sort_keys=True)
+    print_report(manifest)
+    print(f"Packed {clips} clips ({blobs} unique) into '{path}': "
+          f"{total / (1024 * 1024):.1f} MB in {elapsed:.1f}s. Manifest: '{manifest_path}'")
+    pygame.mixer.quit()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--no-normalize"]
+    main(*args, normalize="--no-normalize" not in sys.argv[1:])
@@ -0,0 +1,47 @@
+import os
+import sys
+import json
+import time
+import filecmp
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from game2.level_pack import write_level_pack
+from game2.levels import LEVEL_PACK_PATH, LEVEL_SOURCE_PATH
+
+REQUIRED_FIELDS = ("prompt", "answers", "correct", "success", "fail")
+
+def read_levels(source):
+    """Streams level dicts from a JSON-lines source, one level per line."""
+    with open(source, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            level = json.loads(line)
+            missing = [field for field in REQUIRED_FIELDS if field not in level]
+            if missing:
+                raise ValueError(f"{source}:{line_number} is missing {', '.join(missing)}")
+            if level["correct"] not in level["answers"]:
+                raise ValueError(f"{source}:{line_number}: correct answer '{level['correct']}' is not in answers")
+            yield level
+
+def main(source=LEVEL_SOURCE_PATH, output=LEVEL_PACK_PATH, check_only=False):
+    if check_only:
+        # Rebuild into a temporary file and compare, so a stale pack fails CI
+        with tempfile.TemporaryDirectory() as folder:
+            fresh = os.path.join(folder, "check.levels")
+            write_level_pack(fresh, read_levels(source))
+            if os.path.exists(output) and filecmp.cmp(fresh, output, shallow=False):
+                print(f"'{output}' is up to date.")
+                return 0
+        print(f"'{output}' is out of date; run build_level_pack.py.")
+        return 1
+    start = time.perf_counter()
+    count = write_level_pack(output, read_levels(source))
+    print(f"Packed {count} levels from '{source}' into '{output}' "
+          f"({os.path.getsize(output) / 1024:.1f} KB in {time.perf_counter() - start:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--check"]
+    sys.exit(main(*args, check_only="--check" in sys.argv[1:]))
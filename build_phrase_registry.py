@@ -0,0 +1,140 @@
+import os
+import ast
+import sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from engine.phrases import phrase_key
+from engine.audio_pack import DEFAULT_PACK_PATH, MIXER_FORMAT, ROOT_DIR, AudioPack
+from engine.game_registry import load_registry
+from memory_tiles.key_layout import KeyLayout
+from memory_tiles.memory_tiles import DEFAULT_COLS, DEFAULT_ROWS
+
+# Source files whose say() calls are collected
+SOURCES = ["main.py", os.path.join("memory_tiles", "memory_tiles.py")]
+TABLE_PATH = os.path.join(ROOT_DIR, "engine", "phrase_table.py")
+SPEECH_DIR = os.path.join(ROOT_DIR, "speech")
+
+# Phrases spoken from computed strings, which the source scan cannot see:
+# numbers for the score readout and key names for tile selection. Only the
+# board the launcher starts is covered; bigger boards (see
+# bench_memory_tiles.py) need more clips before they can be registered here.
+MAX_SCORE = DEFAULT_ROWS * DEFAULT_COLS // 2
+TILE_KEYS = "".join(KeyLayout(DEFAULT_ROWS, DEFAULT_COLS).labels)
+DYNAMIC_PHRASES = [str(i) for i in range(max(10, MAX_SCORE + 1))] + [key for key in TILE_KEYS if not key.isdigit()]
+
+def collect_phrases():
+    """Returns every distinct string literal passed to say() or say_parts() in SOURCES, then the
+    menu and game phrases from the game registry, then DYNAMIC_PHRASES."""
+    phrases = []
+    for source in SOURCES:
+        path = os.path.join(ROOT_DIR, source)
+        with open(path) as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or not node.args:
+                continue
+            name = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", None)
+            if name == "say_parts":
+                # Literal parts of a composed utterance; the rest are numbers or sounds
+                for arg in node.args:
+                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str) and arg.value not in phrases:
+                        phrases.append(arg.value)
+                continue
+            if name != "say":
+                continue
+            arg = node.args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                if arg.value not in phrases:
+                    phrases.append(arg.value)
+            else:
+                print(f"  - Note: {source}:{node.lineno} speaks a computed phrase; "
+                      f"make sure it is listed in DYNAMIC_PHRASES")
+    for game in load_registry():
+        for phrase in [game.menu_phrase, game.error_phrase] + game.phrases:
+            if phrase not in phrases:
+                phrases.append(phrase)
+    return phrases + [phrase for phrase in DYNAMIC_PHRASES if phrase not in phrases]
+
+def load_table():
+    """Reads the current table so existing phrases keep their IDs."""
+    if not os.path.exists(TABLE_PATH):
+        return {}, []
+    namespace = {}
+    with open(TABLE_PATH) as f:
+        exec(f.read(), namespace)
+    return namespace["PHRASE_IDS"], namespace["ASSET_KEYS"]
+
+def write_table(phrase_ids, asset_keys):
+    lines = ["# Generated by build_phrase_registry.py. Do not edit by hand.",
+             "# Phrase IDs are stable: new phrases are appended and removed phrases",
+             "# leave a None in ASSET_KEYS so their IDs are never reused.",
+             "PHRASE_IDS = {"]
+    for phrase, phrase_id in sorted(phrase_ids.items(), key=lambda item: item[1]):
+        lines.append(f"    {json.dumps(phrase)}: {phrase_id},")
+    lines += ["}", "ASSET_KEYS = ["]
+    for phrase_id, key in enumerate(asset_keys):
+        lines.append(f"    {json.dumps(key) if key is not None else 'None'},  # {phrase_id}")
+    lines.append("]")
+    with open(TABLE_PATH, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+def available_assets():
+    """
+    Speech clip names the launcher will load: the audio pack's if it was
+    built (main.load_speech_files then ignores the speech folder), otherwise
+    the speech folder's.
+    """
+    folder = set()
+    if os.path.isdir(SPEECH_DIR):
+        folder.update(os.path.splitext(name)[0] for name in os.listdir(SPEECH_DIR) if name.endswith((".wav", ".mp3")))
+    if not os.path.exists(DEFAULT_PACK_PATH):
+        return folder
+    pack = AudioPack(DEFAULT_PACK_PATH)
+    try:
+        if pack.mixer_format != MIXER_FORMAT:
+            return folder # The launcher will not use a pack in another format
+        assets = set(pack.names("speech"))
+    finally:
+        pack.close()
+    unpacked = folder - assets
+    if unpacked:
+        print(f"  - Note: {len(unpacked)} clips in 'speech' are not in the audio pack, so the "
+              f"launcher will not play them. Run build_audio_pack.py.")
+    return assets
+
+def main(check_only=False):
+    phrases = collect_phrases()
+    old_ids, old_keys = load_table()
+    phrase_ids = {}
+    asset_keys = list(old_keys)
+    for phrase in phrases:
+        if phrase in old_ids:
+            phrase_ids[phrase] = old_ids[phrase]
+        else:
+            phrase_ids[phrase] = len(asset_keys)
+            asset_keys.append(phrase_key(phrase))
+    # Retire IDs of phrases that are no longer spoken
+    live_ids = set(phrase_ids.values())
+    asset_keys = [key if phrase_id in live_ids else None for phrase_id, key in enumerate(asset_keys)]
+
+    if check_only:
+        if phrase_ids != old_ids or asset_keys != old_keys:
+            print("Phrase table is out of date. Run build_phrase_registry.py.")
+            return 1
+    else:
+        write_table(phrase_ids, asset_keys)
+        print(f"Wrote {len(phrase_ids)} phrases to '{os.path.relpath(TABLE_PATH, ROOT_DIR)}'")
+
+    assets = available_assets()
+    missing = [phrase for phrase, phrase_id in phrase_ids.items() if asset_keys[phrase_id] not in assets]
+    for phrase in missing:
+        print(f"  - Missing audio for phrase: '{phrase}' ({asset_keys[phrase_ids[phrase]]})")
+    if missing:
+        print(f"{len(missing)} phrases have no audio. Run generate_speech.py.")
+        return 1
+    print("✅ Every phrase has audio.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(check_only="--check" in sys.argv[1:]))
@@ -0,0 +1,153 @@
+import pygame
+import threading
+from engine.playback import ChannelPlayer
+from engine import telemetry
+
+# Lanes, highest priority first. Exclusive lanes are voices that must not talk
+# over each other: while one is busy, lower-priority exclusive lanes are held
+# (their current clip is interrupted and replayed afterwards). Non-exclusive
+# lanes such as effects overlap with anything.
+# channels=None takes whatever is left of the pool.
+DEFAULT_LANES = [
+    {"name": "prompts", "priority": 3, "exclusive": True, "channels": 1},
+    {"name": "speech", "priority": 2, "exclusive": True, "channels": 1},
+    {"name": "effects", "priority": 1, "exclusive": False, "channels": None},
+]
+DEFAULT_CHANNELS = 8
+
+class Lane:
+    """A named group of mixer channels. Clips enqueued on a lane play in order
+    on its first channel; clips played on it take a free channel (or the one
+    that started longest ago)."""
+    def __init__(self, name, priority, exclusive, players):
+        self.name = name
+        self.priority = priority
+        self.exclusive = exclusive
+        self.players = players
+        self.idle_callbacks = []
+
+    @property
+    def busy(self):
+        return any(player.busy for player in self.players)
+
+    @property
+    def pending(self):
+        return sum(player.queued for player in self.players)
+
+    @property
+    def held(self):
+        return self.players[0].held
+
+    def play(self, sound, maxtime=0):
+        free = [player for player in self.players if not player.busy]
+        player = free[0] if free else min(self.players, key=lambda p: p.started_at)
+        player.play(sound, maxtime=maxtime)
+
+    def enqueue(self, sound):
+        self.players[0].enqueue(sound)
+
+    def stop(self):
+        for player in self.players:
+            player.stop()
+
+    def hold(self, held):
+        for player in self.players:
+            if held and not player.held:
+                player.hold()
+            elif not held and player.held:
+                player.resume()
+
+    def handle_event(self, event):
+        return any(player.handle_event(event) for player in self.players)
+
+    def run_idle_callbacks(self):
+        callbacks, self.idle_callbacks = self.idle_callbacks, []
+        for callback in callbacks:
+            callback()
+
+class AudioBus:
+    """
+    The one owner of the mixer's channels. The launcher and every game play
+    sound through named lanes instead of touching pygame.mixer directly, and
+    feed every pygame event through handle_event().
+    """
+    def __init__(self, num_channels=DEFAULT_CHANNELS, lanes=DEFAULT_LANES):
+        fixed = sum(lane["channels"] or 0 for lane in lanes)
+        if num_channels <= fixed:
+            raise ValueError(f"Need more than {fixed} channels for lanes {[lane['name'] for lane in lanes]}")
+        pygame.mixer.set_num_channels(num_channels)
+        self._lock = threading.RLock()
+        self.lanes = {}
+        next_channel = 0
+        for config in lanes:
+            count = config["channels"] or num_channels - fixed
+            players = [ChannelPlayer(pygame.mixer.Channel(next_channel + i)) for i in range(count)]
+            next_channel += count
+            self.lanes[config["name"]] = Lane(config["name"], config["priority"], config["exclusive"], players)
+
+    def play(self, lane, sound, maxtime=0):
+        """Plays a clip on `lane` now, replacing what that lane was playing."""
+        with self._lock:
+            self.lanes[lane].play(sound, maxtime)
+            self._update_holds()
+
+    def enqueue(self, lane, sound):
+        """Plays a clip on `lane` after everything already queued there."""
+        with self._lock:
+            self.lanes[lane].enqueue(sound)
+            self._update_holds()
+            telemetry.record(f"{lane}_queue_depth", self.lanes[lane].pending)
+
+    def stop(self, lane=None):
+        """Stops one lane, or every lane when `lane` is None."""
+        with self._lock:
+            lanes = [self.lanes[lane]] if lane else list(self.lanes.values())
+            for target in lanes:
+                target.stop()
+            self._update_holds()
+            for target in lanes:
+                target.run_idle_callbacks()
+
+    def busy(self, lane):
+        return self.lanes[lane].busy
+
+    def pending(self, lane):
+        """Clips on `lane` still waiting to start, including one already queued on its channel."""
+        return self.lanes[lane].pending
+
+    def when_idle(self, lane, callback):
+        """Calls `callback` once `lane` has nothing left to play."""
+        with self._lock:
+            if self.lanes[lane].busy:
+                self.lanes[lane].idle_callbacks.append(callback)
+                return
+        callback()
+
+    def handle_event(self, event):
+        """Returns True if `event` was a channel end event."""
+        with self._lock:
+            for lane in self.lanes.values():
+                if lane.handle_event(event):
+                    self._update_holds()
+                    if not lane.busy:
+                        lane.run_idle_callbacks()
+                    return True
+        return False
+
+    def _update_holds(self):
+        # A voice lane waits while any higher-priority voice lane is busy
+        voices = sorted((lane for lane in self.lanes.values() if lane.exclusive),
+                        key=lambda lane: lane.priority, reverse=True)
+        blocked = False
+        for lane in voices:
+            lane.hold(blocked)
+            blocked = blocked or lane.busy
+
+_bus = None
+
+def get_bus():
+    """The process-wide AudioBus. The mixer must already be initialised."""
+    global _bus
+    if _bus is None:
+        _bus = AudioBus()
+    return _bus
@@ -0,0 +1,131 @@
+import pygame
+import os
+import mmap
+import json
+import struct
+import hashlib
+
+# Layout: fixed header, PCM blobs, then a JSON index of name -> [offset, length].
+# Blobs hold raw samples in the mixer format recorded in the header, so runtime
+# loading is a slice of the mapped file with no decode step.
+PACK_MAGIC = b"BGAP"
+PACK_VERSION = 1
+HEADER_FORMAT = "<4sHIhHQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+BLOB_ALIGN = 4
+# Must match the launcher's pygame.mixer.pre_init() call
+MIXER_FORMAT = (44100, -16, 2)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PACK_PATH = os.path.join(ROOT_DIR, "assets.pack")
+
+# Pack group name -> source folder (relative to the project root)
+ASSET_GROUPS = {
+    "speech": "speech",
+    "tiles": os.path.join("memory_tiles", "sounds"),
+    "voice_lines": os.path.join("game2", "voice_lines"),
+}
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".ogg")
+
+def write_pack(path, clips, mixer_format):
+    """
+    Writes a pack file. `clips` is an iterable of (name, pcm_bytes).
+    Identical PCM is stored once; every name pointing at it shares the offset.
+    Returns (clip_count, unique_blob_count, total_bytes).
+    """
+    frequency, size, channels = mixer_format
+    index = {}
+    offsets_by_hash = {}
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER_SIZE)
+        for name, pcm in clips:
+            digest = hashlib.sha1(pcm).hexdigest()
+            if digest not in offsets_by_hash:
+                padding = -f.tell() % BLOB_ALIGN
+                f.write(b"\0" * padding)
+                offsets_by_hash[digest] = (f.tell(), len(pcm))
+                f.write(pcm)
+            index[name] = list(offsets_by_hash[digest])
+        index_offset = f.tell()
+        index_bytes = json.dumps({"clips": index}, sort_keys=True).encode("utf-8")
+        f.write(index_bytes)
+        total = f.tell()
+        f.seek(0)
+        f.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, frequency, size, channels,
+                            index_offset, len(index_bytes)))
+    return len(index), len(offsets_by_hash), total
+
+class AudioPack:
+    """Read-only, memory-mapped view of a pack file built by build_audio_pack.py."""
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, version, frequency, size, channels, index_offset, index_length = \
+            struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {PACK_VERSION} audio pack")
+        self.mixer_format = (frequency, size, channels)
+        index = json.loads(bytes(self._view[index_offset:index_offset + index_length]))
+        self.index = index["clips"]
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self, group):
+        """Clip names (without the group prefix) stored under `group`."""
+        prefix = group + "/"
+        return [name[len(prefix):] for name in self.index if name.startswith(prefix)]
+
+    def pcm(self, name):
+        """Zero-copy slice of the mapped file holding the clip's samples."""
+        offset, length = self.index[name]
+        return self._view[offset:offset + length]
+
+    def sound(self, name):
+        # The slice itself is not copied; SDL takes its own copy of the samples
+        # when the Sound is created, which is a memcpy rather than a decode.
+        return pygame.mixer.Sound(buffer=self.pcm(name))
+
+    def close(self):
+        self._view.release()
+        self._map.close()
+
+def asset_path(name):
+    """The loose source file for pack name `name` ("group/key"), or None if it does not exist."""
+    group, key = name.split("/", 1)
+    folder = os.path.join(ROOT_DIR, ASSET_GROUPS[group])
+    for ext in AUDIO_EXTENSIONS:
+        path = os.path.join(folder, key + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+_default_pack = None
+_default_pack_checked = False
+
+def get_pack(path=DEFAULT_PACK_PATH):
+    """
+    Returns the shared pack if it exists and matches the current mixer format,
+    otherwise None so callers fall back to loose files.
+    """
+    global _default_pack, _default_pack_checked
+    if _default_pack_checked:
+        return _default_pack
+    _default_pack_checked = True
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = AudioPack(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not open audio pack '{path}': {e}")
+        return None
+    if pygame.mixer.get_init() != pack.mixer_format:
+        print(f"Warning: Audio pack format {pack.mixer_format} does not match mixer "
+              f"{pygame.mixer.get_init()}. Rebuild it with build_audio_pack.py.")
+        pack.close()
+        return None
+    _default_pack = pack
+    return pack
@@ -0,0 +1,103 @@
+import sounddevice as sd
+import threading
+from collections import deque
+
+# Overflow policies for CaptureRing
+DROP_OLDEST = "drop_oldest"
+DROP_WHILE_PLAYING = "drop_while_playing"
+
+class CaptureRing:
+    """
+    Fixed-size ring of captured audio blocks, filled from the audio callback
+    and drained by the listener thread. When full the oldest block is dropped.
+    With DROP_WHILE_PLAYING, blocks captured while `playing` is set (the game
+    is speaking a prompt) are discarded instead of queued.
+    """
+    def __init__(self, capacity, policy=DROP_OLDEST):
+        if policy not in (DROP_OLDEST, DROP_WHILE_PLAYING):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.capacity = capacity
+        self.policy = policy
+        self.playing = False
+        self.queued = 0
+        self.dropped = 0
+        self._blocks = deque()
+        self._ready = threading.Condition()
+
+    def put(self, block):
+        with self._ready:
+            if self.playing and self.policy == DROP_WHILE_PLAYING:
+                self.dropped += 1
+                return
+            if len(self._blocks) >= self.capacity:
+                self._blocks.popleft()
+                self.dropped += 1
+            self._blocks.append(block)
+            self.queued += 1
+            self._ready.notify()
+
+    def get(self, timeout=None):
+        """Oldest block, or None if nothing arrived within `timeout` seconds."""
+        with self._ready:
+            if not self._blocks:
+                self._ready.wait(timeout)
+            if not self._blocks:
+                return None
+            return self._blocks.popleft()
+
+    def clear(self):
+        with self._ready:
+            self.dropped += len(self._blocks)
+            self._blocks.clear()
+
+    def __len__(self):
+        return len(self._blocks)
+
+class MicrophoneCapture:
+    """
+    16-bit mono microphone input delivered in blocks of `block_ms`, buffered in
+    a CaptureRing holding at most `buffer_ms` of audio. Pass `ring` to deliver
+    the blocks somewhere else instead (such as a SharedAudioRing read by
+    another process). Use as a context manager around the listening loop.
+    """
+    def __init__(self, samplerate=16000, block_ms=50, buffer_ms=2000, policy=DROP_OLDEST, ring=None):
+        self.samplerate = samplerate
+        self.blocksize = samplerate * block_ms // 1000
+        self.ring = ring if ring is not None else CaptureRing(max(1, buffer_ms // block_ms), policy)
+        self.stream = None
+
+    def _callback(self, indata, frames, time, status):
+        self.ring.put(bytes(indata))
+
+    def start(self):
+        self.stream = sd.RawInputStream(samplerate=self.samplerate, blocksize=self.blocksize,
+                                        dtype='int16', channels=1, callback=self._callback)
+        self.stream.start()
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def read(self, timeout=None):
+        return self.ring.get(timeout)
+
+    @property
+    def playing(self):
+        return self.ring.playing
+
+    @playing.setter
+    def playing(self, value):
+        self.ring.playing = value
+
+    def stats(self):
+        """Counters for the game: blocks queued, dropped and currently waiting."""
+        return {"queued": self.ring.queued, "dropped": self.ring.dropped, "depth": len(self.ring)}
@@ -0,0 +1,82 @@
+import pygame
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    import pygame.sndarray
+    from engine.pcm import concatenate, trim_silence
+except ImportError:
+    np = None
+
+CROSSFADE_MS = 15
+
+class UtteranceCompositor:
+    """
+    Builds one gapless Sound out of several clips ("Score", "3", "of", "8"),
+    with each clip's leading and trailing silence trimmed and a short
+    crossfade at every join. Finished utterances are kept in an LRU keyed by
+    their parts. Without NumPy, compose() returns None and callers should
+    queue the clips one by one instead.
+    """
+    def __init__(self, speech_store, max_entries=64, crossfade_ms=CROSSFADE_MS):
+        self.speech_store = speech_store
+        self.max_entries = max_entries
+        self.crossfade_ms = crossfade_ms
+        self.available = np is not None
+        self._cache = OrderedDict()
+        self._trimmed = {}
+        self._lock = threading.Lock()
+
+    def compose(self, parts):
+        """
+        `parts` is a sequence of phrase texts and/or Sounds. Returns the combined
+        Sound, or None if NumPy is missing, a phrase has no clip or every
+        clip is silent once trimmed.
+        """
+        if not self.available:
+            return None
+        key = tuple(parts)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        clips = []
+        for part in key:
+            clip = self._trimmed_clip(part)
+            if clip is None:
+                return None
+            clips.append(clip)
+        if not any(len(clip) for clip in clips):
+            return None
+        frequency = pygame.mixer.get_init()[0]
+        sound = pygame.sndarray.make_sound(concatenate(clips, frequency, self.crossfade_ms))
+        with self._lock:
+            self._cache[key] = sound
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return sound
+
+    def _trimmed_clip(self, part):
+        if part in self._trimmed:
+            return self._trimmed[part]
+        sound = self.speech_store.phrase(part) if isinstance(part, str) else part
+        if sound is None:
+            return None
+        clip = trim_silence(pygame.sndarray.array(sound), pygame.mixer.get_init()[0])
+        self._trimmed[part] = clip
+        return clip
+
+    def prebuild(self, templates):
+        """Composes each list of parts on a background thread, which also consumes
+        `templates` (so a generator can load its clips there). Returns the thread."""
+        thread = threading.Thread(target=self._prebuild, args=(templates,), daemon=True)
+        thread.start()
+        return thread
+
+    def _prebuild(self, templates):
+        for parts in templates:
+            try:
+                self.compose(parts)
+            except (pygame.error, ValueError) as e:
+                print(f"  - Error composing {parts}: {e}")
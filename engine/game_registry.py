@@ -0,0 +1,73 @@
+import time
+import importlib
+import threading
+from engine.phrases import asset_key
+
+# The games the launcher offers, in menu order (the first is on key 1). Each
+# entry is a small info module that the menu can import without loading any
+# game code. An info module defines:
+#   LABEL                   - the game's name, shown and spoken in the menu
+#   PHRASES                 - speech the game opens with or the launcher says for it;
+#                             pre-warmed with the game and registered by build_phrase_registry.py
+#   warm_up(speech)         - loads what the game needs before its first announcement
+#                             (runs on a background thread; until it is done, selecting
+#                             the game only says LOADING_PHRASE)
+#   unavailable()           - a phrase saying why the game cannot start yet, or None
+#   create(screen, speech)  - builds the game, an engine.scene.Scene the menu switches to
+#   ERROR_PHRASE            - spoken if the game fails to start
+GAME_MODULES = ["memory_tiles.game_info", "game2.game_info"]
+# Said when a game is selected before it is ready. It must have a recording
+# (build_phrase_registry.py --check), since a blind player hears nothing else;
+# the loading status itself is only on screen.
+LOADING_PHRASE = "Try again"
+
+class GameEntry:
+    """One registered game: its menu metadata and its background warm-up."""
+    def __init__(self, number, info):
+        self.number = number
+        self.info = info
+        self.label = info.LABEL
+        self.menu_label = f"{number}: {self.label}"
+        self.menu_phrase = f"Press {number} for {self.label}"
+        self.phrases = list(info.PHRASES) + ([LOADING_PHRASE] if LOADING_PHRASE not in info.PHRASES else [])
+        self.error_phrase = info.ERROR_PHRASE
+        # How long the last warm-up took, once it has finished
+        self.warm_ms = None
+        self._warm_thread = None
+        self._lock = threading.Lock()
+
+    def warm_up(self, speech):
+        """Starts warming the game up on a background thread, unless that already happened. Returns the thread."""
+        with self._lock:
+            if self._warm_thread is None:
+                self._warm_thread = threading.Thread(target=self._warm_up, args=(speech,), daemon=True)
+                self._warm_thread.start()
+            return self._warm_thread
+
+    def _warm_up(self, speech):
+        start = time.perf_counter()
+        speech.prewarm([key for key in (asset_key(text) for text in self.phrases) if key is not None])
+        try:
+            self.info.warm_up(speech)
+        except Exception as e:
+            print(f"  - Could not warm up {self.label}: {e}")
+        self.warm_ms = (time.perf_counter() - start) * 1000
+
+    def unavailable(self):
+        """A phrase saying why the game cannot start yet, or None. Never waits for the warm-up."""
+        with self._lock:
+            if self._warm_thread is not None and self._warm_thread.is_alive():
+                return LOADING_PHRASE
+        return self.info.unavailable()
+
+    def create(self, screen, speech):
+        """Builds the game (check unavailable() first). The next announcement warms it up again."""
+        try:
+            return self.info.create(screen, speech)
+        finally:
+            with self._lock:
+                self._warm_thread = None
+
+def load_registry(modules=GAME_MODULES):
+    """The registered games, numbered from 1 in menu order."""
+    return [GameEntry(number, importlib.import_module(name)) for number, name in enumerate(modules, 1)]
@@ -0,0 +1,81 @@
+import numpy as np
+
+# Vectorised helpers for 16-bit PCM arrays shaped (samples,) or (samples, channels),
+# as returned by pygame.sndarray.array().
+SILENCE_THRESHOLD = 300 # about 1% of full scale
+EDGE_PAD_MS = 10
+
+def trim_silence(samples, frequency, threshold=SILENCE_THRESHOLD, pad_ms=EDGE_PAD_MS):
+    """Drops leading and trailing samples quieter than `threshold`, keeping `pad_ms` either side."""
+    level = np.abs(samples.astype(np.int32))
+    if level.ndim > 1:
+        level = level.max(axis=1)
+    loud = np.flatnonzero(level > threshold)
+    if loud.size == 0:
+        return samples[:0]
+    pad = frequency * pad_ms // 1000
+    start = max(0, loud[0] - pad)
+    end = min(len(samples), loud[-1] + 1 + pad)
+    return samples[start:end]
+
+def concatenate(clips, frequency, crossfade_ms):
+    """Joins clips into one array, overlapping each boundary with a linear crossfade."""
+    clips = [clip.astype(np.float32) for clip in clips if len(clip)]
+    if not clips:
+        raise ValueError("Nothing to concatenate")
+    fade = frequency * crossfade_ms // 1000
+    segments = []
+    tail = clips[0]
+    for clip in clips[1:]:
+        overlap = min(fade, len(tail), len(clip))
+        ramp = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        if clip.ndim > 1:
+            ramp = ramp[:, None]
+        segments.append(tail[:len(tail) - overlap])
+        segments.append(tail[len(tail) - overlap:] * (1.0 - ramp) + clip[:overlap] * ramp)
+        tail = clip[overlap:]
+    segments.append(tail)
+    return np.clip(np.concatenate(segments), -32768, 32767).astype(np.int16)
+
+TARGET_RMS_DBFS = -20.0
+PEAK_CEILING_DBFS = -1.0
+
+def normalize_loudness(samples, target_dbfs=TARGET_RMS_DBFS, ceiling_dbfs=PEAK_CEILING_DBFS):
+    """
+    Scales a clip so its RMS level is `target_dbfs`, without letting the peak
+    go above `ceiling_dbfs`. Returns (samples, gain_db).
+    """
+    data = samples.astype(np.float32) / 32768.0
+    rms = float(np.sqrt(np.mean(np.square(data)))) if data.size else 0.0
+    peak = float(np.max(np.abs(data))) if data.size else 0.0
+    if rms == 0.0:
+        return samples, 0.0
+    gain = 10 ** ((target_dbfs - 20 * np.log10(rms)) / 20)
+    gain = min(gain, 10 ** (ceiling_dbfs / 20) / peak)
+    out = np.clip(np.round(data * gain * 32768.0), -32768, 32767).astype(np.int16)
+    return out, float(20 * np.log10(gain))
+
+def pitch_shift(samples, semitones):
+    """Resamples a clip so it plays `semitones` higher (shorter) or lower (longer)."""
+    ratio = 2 ** (semitones / 12)
+    length = max(1, int(len(samples) / ratio))
+    positions = np.arange(length, dtype=np.float64) * ratio
+    source = np.arange(len(samples), dtype=np.float64)
+    if samples.ndim == 1:
+        shifted = np.interp(positions, source, samples)
+    else:
+        shifted = np.stack([np.interp(positions, source, samples[:, channel])
+                            for channel in range(samples.shape[1])], axis=1)
+    return np.clip(np.round(shifted), -32768, 32767).astype(np.int16)
+
+def resample(samples, source_rate, target_rate):
+    """Linear-interpolation resample of a clip from `source_rate` to `target_rate` Hz."""
+    if source_rate == target_rate:
+        return samples
+    return pitch_shift(samples, 12 * np.log2(source_rate / target_rate))
+
+def to_mono(samples):
+    """Averages the channels of a (samples, channels) clip."""
+    if samples.ndim == 1:
+        return samples
+    return np.round(samples.astype(np.float32).mean(axis=1)).astype(np.int16)
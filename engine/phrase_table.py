@@ -0,0 +1,91 @@
+# Generated by build_phrase_registry.py. Do not edit by hand.
+# Phrase IDs are stable: new phrases are appended and removed phrases
+# leave a None in ASSET_KEYS so their IDs are never reused.
+PHRASE_IDS = {
+    "Welcome to the Games Portal": 0,
+    "Please select a game": 1,
+    "Press Escape to quit": 2,
+    "Welcome to Audio Memory Tiles": 3,
+    "Let's begin": 4,
+    "Press I at any time to hear the current score": 5,
+    "Press the Spacebar to stop the current sound": 6,
+    "Use 1 to 4, Q to R, A to  F, etc.": 7,
+    "Score": 8,
+    "of": 9,
+    "It's a match!": 10,
+    "Try again": 11,
+    "That tile is already matched. Try another.": 12,
+    "You picked the same tile again. Choose a different one.": 13,
+    "Congratulations! You found all the pairs. You win!": 14,
+    "Your first choice was a": 15,
+    "Press 1 for Audio Memory Tiles": 16,
+    "Error starting game.": 17,
+    "Press 2 for Daily Routine Adventure": 18,
+    "Error starting game. Please check model files and dependencies.": 19,
+    "0": 20,
+    "1": 21,
+    "2": 22,
+    "3": 23,
+    "4": 24,
+    "5": 25,
+    "6": 26,
+    "7": 27,
+    "8": 28,
+    "9": 29,
+    "Q": 30,
+    "W": 31,
+    "E": 32,
+    "R": 33,
+    "A": 34,
+    "S": 35,
+    "D": 36,
+    "F": 37,
+    "Z": 38,
+    "X": 39,
+    "C": 40,
+    "V": 41,
+}
+ASSET_KEYS = [
+    "welcometothegamesportal",  # 0
+    "pleaseselectagame",  # 1
+    "pressescapetoquit",  # 2
+    "welcometoaudiomemorytiles",  # 3
+    "letsbegin",  # 4
+    "pressiatanytimetohearthecurrentscore",  # 5
+    "pressthespacebartostopthecurrentsound",  # 6
+    "use1to4,qtor,atof,etc",  # 7
+    "score",  # 8
+    "of",  # 9
+    "itsamatch",  # 10
+    "tryagain",  # 11
+    "thattileisalreadymatchedtryanother",  # 12
+    "youpickedthesametileagainchooseadifferentone",  # 13
+    "congratulationsyoufoundallthepairsyouwin",  # 14
+    "yourfirstchoicewasa",  # 15
+    "press1foraudiomemorytiles",  # 16
+    "errorstartinggame",  # 17
+    "press2fordailyroutineadventure",  # 18
+    "errorstartinggamepleasecheckmodelfilesanddependencies",  # 19
+    "0",  # 20
+    "1",  # 21
+    "2",  # 22
+    "3",  # 23
+    "4",  # 24
+    "5",  # 25
+    "6",  # 26
+    "7",  # 27
+    "8",  # 28
+    "9",  # 29
+    "q",  # 30
+    "w",  # 31
+    "e",  # 32
+    "r",  # 33
+    "a",  # 34
+    "s",  # 35
+    "d",  # 36
+    "f",  # 37
+    "z",  # 38
+    "x",  # 39
+    "c",  # 40
+    "v",  # 41
+]
@@ -0,0 +1,15 @@
+from engine.phrase_table import PHRASE_IDS, ASSET_KEYS
+
+def phrase_key(text):
+    """
+    The speech file name (without extension) for a phrase. Only used at build
+    time; at runtime phrases are looked up through the compiled table.
+    """
+    return text.lower().replace(" ", "").replace(":", "").replace("!", "").replace("'", "").replace(".", "")
+
+def asset_key(text):
+    """Asset key of a registered phrase, or None if the phrase is not in the table."""
+    phrase_id = PHRASE_IDS.get(text)
+    if phrase_id is None:
+        return None
+    return ASSET_KEYS[phrase_id]
@@ -0,0 +1,81 @@
+import pygame
+from collections import deque
+from engine import telemetry
+
+class ChannelPlayer:
+    """
+    Plays clips back to back on one mixer channel without polling.
+    The next clip is handed to Channel.queue() so it starts the moment the
+    previous one ends, and the channel's end event (delivered through the
+    pygame event loop) refills the queue.
+    """
+    def __init__(self, channel):
+        self.channel = channel
+        self.end_event = pygame.event.custom_type()
+        channel.set_endevent(self.end_event)
+        self.pending = deque()
+        self.busy = False
+        self.started_at = 0
+        # While held, queued clips wait instead of starting (see AudioBus)
+        self.held = False
+
+    def play(self, sound, maxtime=0):
+        """Plays a clip now, replacing whatever this channel was playing."""
+        self.pending.clear()
+        self.channel.play(sound, maxtime=maxtime)
+        self.started_at = pygame.time.get_ticks()
+        self.busy = True
+        telemetry.since_mark("key", "key_to_audio_ms")
+
+    def enqueue(self, sound):
+        """Plays a clip after everything already queued on this channel."""
+        self.pending.append(sound)
+        self._feed()
+
+    def interrupt(self):
+        """Stops the current clip but keeps it, and everything queued, for later."""
+        current = self.channel.get_sound()
+        queued = self.channel.get_queue()
+        if queued is not None:
+            self.pending.appendleft(queued)
+        if current is not None:
+            self.pending.appendleft(current)
+        self.channel.stop()
+        self.busy = bool(self.pending)
+
+    @property
+    def queued(self):
+        """Clips waiting to start, including the one already handed to Channel.queue()."""
+        return len(self.pending) + (self.channel.get_queue() is not None)
+
+    def stop(self):
+        self.pending.clear()
+        self.channel.stop()
+        self.busy = False
+
+    def hold(self):
+        self.held = True
+        if self.channel.get_busy():
+            self.interrupt()
+
+    def resume(self):
+        self.held = False
+        self._feed()
+
+    def handle_event(self, event):
+        """Returns True if `event` is this channel's end event."""
+        if event.type != self.end_event:
+            return False
+        self._feed()
+        return True
+
+    def _feed(self):
+        # The end event can be stale (e.g. from stop()), so trust the channel, not the event
+        if not self.held:
+            if self.pending and not self.channel.get_busy():
+                self.channel.play(self.pending.popleft())
+                self.started_at = pygame.time.get_ticks()
+                telemetry.since_mark("key", "key_to_audio_ms")
+            if self.pending and self.channel.get_queue() is None:
+                self.channel.queue(self.pending.popleft())
+        self.busy = self.channel.get_busy() or bool(self.pending)
@@ -0,0 +1,126 @@
+import time
+import pygame
+from engine import telemetry
+from engine.audio_bus import get_bus
+
+class Scene:
+    """
+    Something the Engine runs full-screen: the launcher menu or a game.
+    While a scene is current the engine calls handle_event() for each event,
+    then update() and render() once per frame. enter() runs when the scene
+    becomes current and exit() when it is left. A scene leaves by calling
+    finish(); the engine then goes back to its home scene (the menu).
+
+    `fps` is the frame rate while the scene is current. With fps None the
+    engine sleeps until an event arrives instead of ticking.
+    """
+    name = "scene"
+    fps = 30
+
+    def __init__(self):
+        self.engine = None
+        self.finished = False
+
+    def enter(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def render(self, screen):
+        pass
+
+    def exit(self):
+        pass
+
+    def finish(self):
+        self.finished = True
+
+    def run(self):
+        """Runs this scene on its own until it finishes (for tools and benchmarks)."""
+        Engine(pygame.display.get_surface()).run(self)
+
+class Engine:
+    """
+    The one loop of the launcher. It owns the window and the audio bus for the
+    whole run, so moving between the menu and the games never re-initialises
+    pygame or reloads anything. Every switch is timed, from the start of the
+    frame that asked for it to the end of the new scene's first frame; the times are kept in `switch_ms` and recorded as
+    scene_switch_ms telemetry.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.clock = None
+        self.audio = get_bus()
+        self.home = None
+        self.scene = None
+        self.switch_ms = []
+        self._frame_started = time.perf_counter()
+        self._switch_started = None
+
+    def switch(self, scene):
+        """Leaves the current scene for `scene`."""
+        self._switch_started = self._frame_started
+        if self.scene is not None:
+            self.scene.exit()
+        scene.engine = self
+        scene.finished = False
+        self.scene = scene
+        # Frame pacing starts over, so the first tick does not count the time spent in other scenes
+        self.clock = pygame.time.Clock()
+        scene.enter()
+
+    def run(self, home):
+        """Runs `home` and whatever it switches to, until `home` itself finishes."""
+        self.home = home
+        self.switch(home)
+        self._switch_started = None
+        while self.scene is not None:
+            scene = self.scene
+            frame = telemetry.FrameTimer(f"{scene.name}_frame_ms")
+            if scene.fps or self._switch_started is not None:
+                # A scene just switched to draws its first frame without waiting
+                events = pygame.event.get()
+            else:
+                # Sleep until something happens: a key, a speech clip ending or a status change
+                events = [pygame.event.wait()] + pygame.event.get()
+            self._frame_started = time.perf_counter()
+            frame.begin()
+            for event in events:
+                if self.audio.handle_event(event):
+                    continue
+                if event.type == pygame.KEYDOWN:
+                    telemetry.mark("key")
+                # After a switch the rest of the events go to the new scene
+                if not self.scene.finished:
+                    self.scene.handle_event(event)
+            if not self.scene.finished:
+                self.scene.update()
+            if not self.scene.finished:
+                self.scene.render(self.screen)
+                self._switched()
+            frame.end()
+            if self.scene.finished:
+                self._leave(self.scene)
+            elif self.scene.fps:
+                self.clock.tick(self.scene.fps)
+
+    def _leave(self, scene):
+        if scene is self.home:
+            scene.exit()
+            self.scene = None
+        else:
+            self.switch(self.home)
+
+    def _switched(self):
+        """Ends the timing of a switch once the new scene has drawn its first frame."""
+        if self._switch_started is None:
+            return
+        elapsed = (time.perf_counter() - self._switch_started) * 1000
+        self._switch_started = None
+        self.switch_ms.append((self.scene.name, elapsed))
+        telemetry.record("scene_switch_ms", elapsed)
+        print(f"Switched to {self.scene.name} in {elapsed:.1f} ms")
@@ -0,0 +1,86 @@
+import time
+from multiprocessing import shared_memory
+
+# Header: total bytes ever written, total bytes ever read (uint64 each)
+HEADER_BYTES = 16
+
+class SharedAudioRing:
+    """
+    Byte ring in a multiprocessing.shared_memory block, for passing captured
+    audio from the game process to the recognition worker without pickling.
+    One producer (the capture callback) and one consumer (the worker); each
+    side only ever advances its own counter. Pass `name` to attach to a ring
+    created by another process.
+
+    A full ring never overwrites unread audio: the new block is dropped and
+    counted instead. With `drop_while_playing`, blocks captured while
+    `playing` is set are discarded as well, like CaptureRing's
+    DROP_WHILE_PLAYING policy.
+    """
+    def __init__(self, capacity=None, name=None, drop_while_playing=False):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_BYTES + capacity)
+            self.shm.buf[:HEADER_BYTES] = bytes(HEADER_BYTES)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self.capacity = self.shm.size - HEADER_BYTES if capacity is None else capacity
+        self.drop_while_playing = drop_while_playing
+        self._counters = self.shm.buf[:HEADER_BYTES].cast("Q")
+        self._data = self.shm.buf[HEADER_BYTES:HEADER_BYTES + self.capacity]
+        # Producer-side counters, kept in the process that captures
+        self.playing = False
+        self.queued = 0
+        self.dropped = 0
+
+    # --- Producer ---
+    def put(self, block):
+        if self.playing and self.drop_while_playing:
+            self.dropped += 1
+            return
+        written, read = self._counters[0], self._counters[1]
+        if len(block) > self.capacity - (written - read):
+            self.dropped += 1
+            return
+        start = written % self.capacity
+        first = min(len(block), self.capacity - start)
+        self._data[start:start + first] = block[:first]
+        self._data[:len(block) - first] = block[first:]
+        # Publish only once the bytes are in place
+        self._counters[0] = written + len(block)
+        self.queued += 1
+
+    # --- Consumer ---
+    def read(self, max_bytes, timeout=None):
+        """Up to `max_bytes` of unread audio, or None if nothing arrived within `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            written, read = self._counters[0], self._counters[1]
+            if written != read:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.005)
+        count = min(max_bytes, written - read)
+        start = read % self.capacity
+        first = min(count, self.capacity - start)
+        data = bytes(self._data[start:start + first]) + bytes(self._data[:count - first])
+        self._counters[1] = read + count
+        return data
+
+    def discard(self):
+        """Skips everything written so far (consumer side)."""
+        self._counters[1] = self._counters[0]
+
+    def __len__(self):
+        return self._counters[0] - self._counters[1]
+
+    def close(self):
+        """Detaches from the ring; the creating process also frees it."""
+        self._counters.release()
+        self._data.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,110 @@
+import pygame
+import os
+import threading
+from collections import OrderedDict
+from engine.phrases import asset_key
+from engine import telemetry
+
+SPEECH_EXTENSIONS = (".wav", ".mp3")
+
+class SpeechStore:
+    """
+    Dict-like store of speech clips. Clip names are indexed up front, each clip
+    is loaded on first lookup and kept in an LRU bounded by decoded size.
+    `sources` maps a key to whatever `load` needs to build the Sound.
+    """
+    def __init__(self, sources, load=pygame.mixer.Sound, max_bytes=4 * 1024 * 1024):
+        self.paths = dict(sources)
+        self.load = load
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_folder(cls, speech_dir, **kwargs):
+        """Records the name of every speech file without decoding any of them."""
+        sources = {}
+        for filename in os.listdir(speech_dir):
+            if filename.endswith(SPEECH_EXTENSIONS):
+                key = os.path.splitext(filename)[0]
+                sources[key] = os.path.join(speech_dir, filename)
+        return cls(sources, **kwargs)
+
+    @classmethod
+    def from_pack(cls, pack, group, **kwargs):
+        """Serves the clips of one audio pack group."""
+        sources = {key: f"{group}/{key}" for key in pack.names(group)}
+        return cls(sources, load=pack.sound, **kwargs)
+
+    def __contains__(self, key):
+        return key in self.paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def keys(self):
+        return self.paths.keys()
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key][0]
+            self.misses += 1
+        sound = telemetry.timed_load("speech_load_ms", self.load, self.paths[key])
+        self._store(key, sound)
+        return sound
+
+    def get(self, key, default=None):
+        if key not in self.paths:
+            return default
+        try:
+            return self[key]
+        except pygame.error as e:
+            print(f"  - Error loading speech '{key}': {e}")
+            return default
+
+    def phrase(self, text):
+        """Sound for a registered phrase, or None if the phrase or its clip is missing."""
+        key = asset_key(text)
+        if key is None:
+            return None
+        return self.get(key)
+
+    def _store(self, key, sound):
+        size = sound_size(sound)
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = (sound, size)
+            self._cache_bytes += size
+            # Always keep the clip we just loaded, even if it alone is over budget
+            while self._cache_bytes > self.max_bytes and len(self._cache) > 1:
+                _, (_, old_size) = self._cache.popitem(last=False)
+                self._cache_bytes -= old_size
+
+    def prewarm(self, keys):
+        """Loads the given clips on a background thread. Returns the thread."""
+        keys = [key for key in keys if key in self.paths]
+        thread = threading.Thread(target=self._prewarm, args=(keys,), daemon=True)
+        thread.start()
+        return thread
+
+    def _prewarm(self, keys):
+        for key in keys:
+            with self._lock:
+                if key in self._cache:
+                    continue
+            try:
+                self._store(key, telemetry.timed_load("speech_load_ms", self.load, self.paths[key]))
+            except pygame.error as e:
+                print(f"  - Error pre-warming speech '{key}': {e}")
+
+def sound_size(sound):
+    """Approximate size in bytes of a decoded Sound in the mixer's format."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * (abs(size) // 8))
@@ -0,0 +1,112 @@
+import os
+import json
+import time
+import pygame
+
+# Launcher cold-start helpers: a phase profiler for `main.py --profile-startup`
+# and an on-disk cache of the work the first frame needs but that never
+# changes between runs (font lookups and the scaled logo).
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ROOT_DIR, ".startup_cache")
+INDEX_PATH = os.path.join(CACHE_DIR, "index.json")
+# Fonts that were not installed are looked up again after this long
+FONT_MISS_SECONDS = 7 * 24 * 3600
+# Time-to-first-frame target checked by --profile-startup
+FIRST_FRAME_BUDGET_MS = 250
+
+class StartupProfiler:
+    """Times the named phases of startup. Does nothing but keep timestamps unless printed."""
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.last = self.started
+        self.phases = []
+        self.milestones = {}
+
+    def phase(self, name):
+        """Ends the current phase, naming it `name`."""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000, (now - self.started) * 1000))
+        self.last = now
+
+    def milestone(self, name):
+        """Ends the current phase and remembers the total time at which `name` was reached."""
+        self.phase(name)
+        self.milestones[name] = self.phases[-1][2]
+
+    def report(self, budget_ms=FIRST_FRAME_BUDGET_MS):
+        print(f"{'phase':<28} {'ms':>9} {'total ms':>9}")
+        for name, elapsed, total in self.phases:
+            print(f"{name:<28} {elapsed:>9.1f} {total:>9.1f}")
+        first_frame = self.milestones.get("first frame")
+        if first_frame is not None:
+            verdict = "within" if first_frame <= budget_ms else "OVER"
+            print(f"Time to first frame: {first_frame:.1f} ms ({verdict} the {budget_ms} ms budget)")
+
+class StartupCache:
+    """
+    Font paths and pre-scaled images from earlier runs, in .startup_cache.
+    Every entry remembers the modification time of its source file and is
+    rebuilt when that changes.
+    """
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.changed = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        self.index.setdefault("fonts", {})
+        self.index.setdefault("images", {})
+
+    def font(self, name, size):
+        """Like pygame.font.SysFont(name, size), without searching the system fonts on every start."""
+        entry = self.index["fonts"].get(name)
+        if not self._font_valid(entry):
+            path = pygame.font.match_font(name)
+            entry = {"path": path, "mtime": os.path.getmtime(path) if path else time.time()}
+            self.index["fonts"][name] = entry
+            self.changed = True
+        # No match falls back to pygame's default font, as SysFont does
+        return pygame.font.Font(entry["path"], size)
+
+    def _font_valid(self, entry):
+        if entry is None:
+            return False
+        if entry["path"] is None:
+            return time.time() - entry["mtime"] < FONT_MISS_SECONDS
+        return os.path.exists(entry["path"]) and os.path.getmtime(entry["path"]) == entry["mtime"]
+
+    def scaled_image(self, path, size):
+        """The image at `path` scaled to `size`, from the cache when the source is unchanged."""
+        key = f"{os.path.relpath(path, ROOT_DIR)}@{size[0]}x{size[1]}"
+        mtime = os.path.getmtime(path)
+        entry = self.index["images"].get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            try:
+                return pygame.image.load(os.path.join(CACHE_DIR, entry["file"]))
+            except (pygame.error, FileNotFoundError):
+                pass
+        surface = pygame.transform.scale(pygame.image.load(path), size)
+        name = f"{os.path.splitext(os.path.basename(path))[0]}_{size[0]}x{size[1]}.png"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            pygame.image.save(surface, os.path.join(CACHE_DIR, name))
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not cache '{key}': {e}")
+        else:
+            self.index["images"][key] = {"mtime": mtime, "file": name}
+            self.changed = True
+        return surface
+
+    def save(self):
+        """Writes the index if anything was added."""
+        if not self.changed:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, indent=2)
+            self.changed = False
+        except OSError as e:
+            print(f"Warning: Could not write startup cache: {e}")
@@ -0,0 +1,159 @@
+import os
+import json
+import time
+import atexit
+import threading
+from array import array
+
+# Optional field telemetry. Off unless BLINDGAME_TELEMETRY is set (to 1 for
+# the default file, or to a path) or the launcher is started with
+# --telemetry. Hooks write samples into preallocated per-metric rings; a
+# background thread flushes them once a second to a rotating JSON-lines
+# file, one {"t", "metric", "value"} object per sample. While disabled,
+# every hook is a single global check and returns.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT_DIR, "telemetry", "telemetry.jsonl")
+RING_CAPACITY = 4096
+FLUSH_SECONDS = 1.0
+MAX_FILE_BYTES = 1024 * 1024
+BACKUP_FILES = 3
+# A mark nothing answered within this many seconds (a key with no sound) is dropped
+MARK_TIMEOUT = 5.0
+
+class Ring:
+    """Fixed-size buffer of (timestamp, value) samples for one metric."""
+    def __init__(self, capacity=RING_CAPACITY):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self.written = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def add(self, timestamp, value):
+        slot = self.written % self.capacity
+        self.times[slot] = timestamp
+        self.values[slot] = value
+        self.written += 1
+
+    def drain(self):
+        """Samples written since the last drain, oldest first. Overwritten ones are counted as dropped."""
+        written = self.written
+        start = max(self.flushed, written - self.capacity)
+        self.dropped += start - self.flushed
+        samples = [(self.times[i % self.capacity], self.values[i % self.capacity]) for i in range(start, written)]
+        self.flushed = written
+        return samples
+
+class Recorder:
+    def __init__(self, path):
+        # logging is only imported when telemetry is switched on, keeping it off the launcher's startup path
+        import logging
+        from logging.handlers import RotatingFileHandler
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.rings = {}
+        self.marks = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.logger = logging.getLogger("blindgame.telemetry")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.handler = RotatingFileHandler(path, maxBytes=MAX_FILE_BYTES, backupCount=BACKUP_FILES)
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger.addHandler(self.handler)
+        self.thread = threading.Thread(target=self._run, name="telemetry-flush", daemon=True)
+        self.thread.start()
+
+    def record(self, metric, value):
+        ring = self.rings.get(metric)
+        if ring is None:
+            with self._lock:
+                ring = self.rings.setdefault(metric, Ring())
+        ring.add(time.time(), value)
+
+    def _run(self):
+        while not self._stop.wait(FLUSH_SECONDS):
+            self.flush()
+
+    def flush(self):
+        for metric, ring in list(self.rings.items()):
+            for timestamp, value in ring.drain():
+                self.logger.info(json.dumps({"t": round(timestamp, 4), "metric": metric, "value": round(value, 4)}))
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self.thread.join(timeout=2)
+        self.flush()
+        dropped = {metric: ring.dropped for metric, ring in self.rings.items() if ring.dropped}
+        if dropped:
+            self.logger.info(json.dumps({"t": time.time(), "dropped": dropped}))
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+_recorder = None
+
+def enable(path=DEFAULT_PATH):
+    """Starts recording to `path`. Safe to call more than once."""
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder(path)
+        atexit.register(_recorder.close)
+        print(f"Telemetry enabled, writing to '{path}'")
+    return _recorder
+
+def enabled():
+    return _recorder is not None
+
+# --- Hooks ---
+def record(metric, value):
+    """Adds one sample."""
+    if _recorder is None:
+        return
+    _recorder.record(metric, value)
+
+def mark(name):
+    """Remembers now as the start of an interval finished by since_mark()."""
+    if _recorder is None:
+        return
+    _recorder.marks[name] = time.perf_counter()
+
+def since_mark(name, metric):
+    """Records milliseconds since mark(name) under `metric`, once per mark."""
+    if _recorder is None:
+        return
+    start = _recorder.marks.pop(name, None)
+    if start is not None and time.perf_counter() - start < MARK_TIMEOUT:
+        _recorder.record(metric, (time.perf_counter() - start) * 1000)
+
+class FrameTimer:
+    """Records the work time of each loop iteration: begin() after the frame wait, end() before it."""
+    def __init__(self, metric):
+        self.metric = metric
+        self.started = None
+
+    def begin(self):
+        if _recorder is None:
+            return
+        self.started = time.perf_counter()
+
+    def end(self):
+        if _recorder is None or self.started is None:
+            return
+        _recorder.record(self.metric, (time.perf_counter() - self.started) * 1000)
+        self.started = None
+
+def timed_load(metric, load, *args):
+    """Calls load(*args), recording how long it took in milliseconds."""
+    if _recorder is None:
+        return load(*args)
+    start = time.perf_counter()
+    result = load(*args)
+    _recorder.record(metric, (time.perf_counter() - start) * 1000)
+    return result
+
+_setting = os.environ.get("BLINDGAME_TELEMETRY")
+if _setting:
+    enable(DEFAULT_PATH if _setting == "1" else _setting)
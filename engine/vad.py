@@ -0,0 +1,85 @@
+import numpy as np
+
+# Energy and zero-crossing voice activity detection for 16 kHz mono 16-bit
+# audio, computed per 10 ms frame over a whole captured block at once.
+FRAME_MS = 10
+# A frame is speech when its RMS is SPEECH_RATIO times the noise floor (about
+# +10 dB), or half that for fricatives (s, f, sh) with a high zero-crossing rate
+SPEECH_RATIO = 3.0
+UNVOICED_ZCR = 0.25
+MIN_SPEECH_RMS = 150
+INITIAL_NOISE_RMS = 50
+NOISE_ADAPT = 0.05
+# Speech frames a block needs to open the gate
+MIN_SPEECH_FRAMES = 2
+# Audio still decoded after the last speech, so words can finish and endpoint
+HANGOVER_MS = 500
+# Audio kept from before the gate opens, so the first word is heard from its start
+PREROLL_MS = 200
+
+class VoiceActivityGate:
+    """
+    Sits between capture and the recognizer and only passes audio while
+    someone is speaking. admit() takes each captured block and returns the
+    bytes to decode: nothing during silence, the block plus its pre-roll
+    when speech starts, and every block until HANGOVER_MS after it stops.
+    The noise floor adapts to the room from the blocks judged silent.
+    """
+    def __init__(self, samplerate=16000):
+        self.samplerate = samplerate
+        self.frame = samplerate * FRAME_MS // 1000
+        self.noise = float(INITIAL_NOISE_RMS)
+        self.hangover = 0.0
+        self.preroll = []
+        self.preroll_bytes = 0
+        self.max_preroll_bytes = samplerate * 2 * PREROLL_MS // 1000
+        self.seconds_in = 0.0
+        self.seconds_passed = 0.0
+
+    def is_speech(self, block):
+        """True if `block` holds at least MIN_SPEECH_FRAMES speech frames. Updates the noise floor otherwise."""
+        samples = np.frombuffer(block, dtype=np.int16)
+        count = len(samples) // self.frame
+        if count == 0:
+            return False
+        frames = samples[:count * self.frame].reshape(count, self.frame).astype(np.float32)
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+        threshold = max(MIN_SPEECH_RMS, self.noise * SPEECH_RATIO)
+        speech = (rms > threshold) | ((rms > threshold / 2) & (zcr > UNVOICED_ZCR))
+        if np.count_nonzero(speech) >= MIN_SPEECH_FRAMES:
+            return True
+        self.noise += NOISE_ADAPT * (float(np.mean(rms)) - self.noise)
+        return False
+
+    def admit(self, block):
+        """The audio to decode for this block: bytes, or None while the gate is closed."""
+        seconds = len(block) / (2 * self.samplerate)
+        self.seconds_in += seconds
+        if self.is_speech(block):
+            self.hangover = HANGOVER_MS / 1000
+        elif self.hangover > 0:
+            self.hangover -= seconds
+        else:
+            self.preroll.append(block)
+            self.preroll_bytes += len(block)
+            while self.preroll_bytes - len(self.preroll[0]) >= self.max_preroll_bytes:
+                self.preroll_bytes -= len(self.preroll.pop(0))
+            return None
+        data = b"".join(self.preroll) + block if self.preroll else block
+        self.seconds_passed += len(data) / (2 * self.samplerate)
+        self.preroll = []
+        self.preroll_bytes = 0
+        return data
+
+    def reset(self):
+        """Closes the gate and forgets the pre-roll (a new level starts). The noise floor is kept."""
+        self.hangover = 0.0
+        self.preroll = []
+        self.preroll_bytes = 0
+
+    @property
+    def skipped_fraction(self):
+        if not self.seconds_in:
+            return 0.0
+        return max(0.0, 1 - self.seconds_passed / self.seconds_in)
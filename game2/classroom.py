@@ -0,0 +1,238 @@
+"""
+Classroom mode: many Daily Routine Adventure sessions on one machine.
+
+Each session is a RoutineSession with its own recognizer; all of them share
+the one Vosk model from model_cache, and their audio is decoded by a fixed
+pool of worker threads (Vosk releases the GIL while decoding, so the pool
+scales across cores). Sessions are scheduled round-robin, at most
+SLICE_SECONDS of audio at a time, so one busy stream cannot starve the rest.
+
+Usage:
+  python game2/classroom.py serve [--port PORT] [--workers N]
+  python game2/classroom.py files [--workers N] FILE.wav [FILE.wav ...]
+
+`serve` accepts one session per TCP connection: the client streams raw
+16 kHz mono 16-bit PCM and receives the session's events as JSON lines.
+`files` runs one session per recording, as fast as the pool can decode.
+"""
+import os
+import sys
+import json
+import time
+import wave
+import queue
+import argparse
+import threading
+import socketserver
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game2 import model_cache
+from game2.levels import load_levels
+from game2.model_cache import SAMPLE_RATE
+from game2.session import RoutineSession
+
+DEFAULT_PORT = 5055
+BLOCK_BYTES = SAMPLE_RATE * 2 // 10 # 100 ms per AcceptWaveform call
+SLICE_SECONDS = 1.0
+
+class _Slot:
+    """A session plus its undecoded audio and scheduling state."""
+    def __init__(self, session, on_event):
+        self.session = session
+        self.on_event = on_event
+        self.pending = bytearray()
+        self.fed_at = None
+        self.scheduled = False
+        self.closed = False
+        self.lock = threading.Lock()
+
+class ClassroomEngine:
+    """
+    Runs any number of sessions over `workers` decoding threads.
+    `on_event(event)` is given per session and is called from a worker thread.
+    """
+    def __init__(self, workers=None, levels=None):
+        self.workers = workers or os.cpu_count()
+        self.levels = levels if levels is not None else load_levels()
+        self.model = model_cache.get_model()
+        self._slots = {}
+        self._ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._threads = []
+        # Throughput counters, updated by the workers
+        self.audio_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.queue_delays = []
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"classroom-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for _ in self._threads:
+            self._ready.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        for session_id in list(self._slots):
+            self.close_session(session_id)
+
+    # --- Sessions ---
+    def open_session(self, on_event):
+        """Starts a new session at level 0 and sends its first prompt. Returns its id."""
+        with self._lock:
+            session_id = self._next_id
+            self._next_id += 1
+        from vosk import KaldiRecognizer
+        session = RoutineSession(session_id, KaldiRecognizer(self.model, SAMPLE_RATE), self.levels)
+        slot = _Slot(session, on_event)
+        with self._lock:
+            self._slots[session_id] = slot
+        on_event(session.prompt_event())
+        return session_id
+
+    def feed(self, session_id, data):
+        """Queues captured audio for a session. Never blocks on decoding."""
+        slot = self._slots.get(session_id)
+        if slot is None:
+            return
+        with slot.lock:
+            if slot.closed or slot.session.finished:
+                return
+            slot.pending.extend(data)
+            if slot.fed_at is None:
+                slot.fed_at = time.perf_counter()
+            if not slot.scheduled:
+                slot.scheduled = True
+                self._ready.put(slot)
+
+    def close_session(self, session_id):
+        with self._lock:
+            slot = self._slots.pop(session_id, None)
+        if slot is not None:
+            with slot.lock:
+                slot.closed = True
+                slot.pending.clear()
+
+    # --- Workers ---
+    def _work(self):
+        slice_bytes = int(SLICE_SECONDS * SAMPLE_RATE * 2)
+        while True:
+            slot = self._ready.get()
+            if slot is None:
+                return
+            with slot.lock:
+                data = bytes(slot.pending[:slice_bytes])
+                del slot.pending[:slice_bytes]
+                fed_at, slot.fed_at = slot.fed_at, (time.perf_counter() if slot.pending else None)
+            start = time.perf_counter()
+            cpu_start = time.thread_time()
+            events = []
+            for i in range(0, len(data), BLOCK_BYTES):
+                if slot.closed:
+                    break
+                events += slot.session.accept(data[i:i + BLOCK_BYTES])
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                self.audio_seconds += len(data) / (SAMPLE_RATE * 2)
+                self.decode_seconds += cpu
+                if fed_at is not None:
+                    self.queue_delays.append(start - fed_at)
+            for event in events:
+                slot.on_event(event)
+            with slot.lock:
+                if slot.pending and not slot.closed and not slot.session.finished:
+                    self._ready.put(slot)
+                else:
+                    slot.scheduled = False
+                    slot.pending.clear()
+
+    def wait_idle(self):
+        """Blocks until every queued block of audio has been decoded."""
+        while any(slot.scheduled for slot in list(self._slots.values())):
+            time.sleep(0.05)
+
+    def stats(self):
+        """Sessions open, audio decoded, and how many real-time streams one core keeps up with."""
+        with self._lock:
+            return {"sessions": len(self._slots), "workers": self.workers,
+                    "audio_seconds": self.audio_seconds, "decode_cpu_seconds": self.decode_seconds,
+                    "sessions_per_core": self.audio_seconds / self.decode_seconds if self.decode_seconds else None}
+
+# --- Socket front end ---
+class ClassroomServer(socketserver.ThreadingTCPServer):
+    """One session per connection: PCM in, JSON-line events out."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, engine, host="127.0.0.1", port=DEFAULT_PORT):
+        super().__init__((host, port), _SessionHandler)
+        self.engine = engine
+
+class _SessionHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        engine = self.server.engine
+        send_lock = threading.Lock()
+
+        def send(event):
+            with send_lock:
+                try:
+                    self.request.sendall((json.dumps(event) + "\n").encode("utf-8"))
+                except OSError:
+                    pass
+
+        session_id = engine.open_session(send)
+        try:
+            # Audio after the last level is ignored; the client hangs up when it is done
+            while True:
+                try:
+                    data = self.request.recv(BLOCK_BYTES)
+                except OSError:
+                    break
+                if not data:
+                    break
+                engine.feed(session_id, data)
+        finally:
+            engine.close_session(session_id)
+
+# --- Command line ---
+def run_files(engine, paths):
+    """Runs one session per recording and prints every event."""
+    def on_event(event):
+        print(json.dumps(event))
+    for path in paths:
+        with wave.open(path, "rb") as wav:
+            if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError(f"{path} must be 16 kHz mono 16-bit")
+            engine.feed(engine.open_session(on_event), wav.readframes(wav.getnframes()))
+    start = time.perf_counter()
+    engine.wait_idle()
+    print(json.dumps(dict(engine.stats(), wall_seconds=time.perf_counter() - start)))
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Run Daily Routine Adventure for many players at once.")
+    parser.add_argument("mode", choices=["serve", "files"])
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+    engine = ClassroomEngine(args.workers).start()
+    if args.mode == "files":
+        run_files(engine, args.paths)
+        engine.stop()
+        return
+    with ClassroomServer(engine, port=args.port) as server:
+        print(f"Classroom server listening on port {args.port} with {engine.workers} workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(engine.stats()))
+    engine.stop()
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
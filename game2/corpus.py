@@ -0,0 +1,121 @@
+"""
+Labelled recordings of Daily Routine answers, for comparing speech models
+offline (see benchmarks/bench_models.py).
+
+A corpus is a folder of 16 kHz mono 16-bit WAV files plus manifest.jsonl,
+one {"file", "level", "answer"} object per recording. `answer` is what the
+speaker said: one of the level's answers, or "" for a recording that should
+not be accepted as either.
+
+Usage:
+  python game2/corpus.py import LEVEL ANSWER FILE.wav [FILE.wav ...] [--corpus DIR]
+  python game2/corpus.py record LEVEL ANSWER [--count N] [--seconds S] [--corpus DIR]
+  python game2/corpus.py list [--corpus DIR]
+
+`import` converts other sample rates and stereo files on the way in.
+`record` needs a microphone and the sounddevice package.
+"""
+import os
+import sys
+import json
+import time
+import wave
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from game2.levels import load_levels
+from game2.model_cache import SAMPLE_RATE
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+MANIFEST_NAME = "manifest.jsonl"
+RECORD_SECONDS = 3.0
+
+def load_corpus(corpus_dir=DEFAULT_CORPUS_DIR):
+    """The corpus entries, each with `path` filled in. Empty if there is no corpus yet."""
+    manifest = os.path.join(corpus_dir, MANIFEST_NAME)
+    if not os.path.exists(manifest):
+        return []
+    with open(manifest, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    for entry in entries:
+        entry["path"] = os.path.join(corpus_dir, entry["file"])
+    return entries
+
+def check_label(level_index, answer):
+    levels = load_levels()
+    if not 0 <= level_index < len(levels):
+        raise ValueError(f"There is no level {level_index}; levels are 0 to {len(levels) - 1}")
+    answers = levels[level_index].get("answers", [])
+    if answer and answer not in answers:
+        raise ValueError(f"Level {level_index} answers are {answers}, not '{answer}'")
+
+def add_recording(corpus_dir, level_index, answer, pcm):
+    """Stores 16 kHz mono 16-bit `pcm` as a new corpus entry. Returns its file name."""
+    os.makedirs(corpus_dir, exist_ok=True)
+    label = answer.replace(" ", "_") or "none"
+    name = f"level{level_index}_{label}_{time.strftime('%Y%m%d_%H%M%S')}_{len(load_corpus(corpus_dir))}.wav"
+    with wave.open(os.path.join(corpus_dir, name), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm)
+    with open(os.path.join(corpus_dir, MANIFEST_NAME), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"file": name, "level": level_index, "answer": answer}) + "\n")
+    return name
+
+def read_pcm(path):
+    """A WAV file as 16 kHz mono 16-bit bytes, converting it if needed."""
+    with wave.open(path, "rb") as wav:
+        rate, channels, width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+        frames = wav.readframes(wav.getnframes())
+    if width != 2:
+        raise ValueError(f"{path} must be 16-bit")
+    if rate == SAMPLE_RATE and channels == 1:
+        return frames
+    import numpy as np
+    from engine.pcm import resample, to_mono
+    samples = np.frombuffer(frames, dtype=np.int16)
+    if channels > 1:
+        samples = to_mono(samples.reshape(-1, channels))
+    return resample(samples, rate, SAMPLE_RATE).tobytes()
+
+def record(seconds):
+    import sounddevice as sd
+    samples = sd.rec(int(seconds * SAMPLE_RATE), samplerate=SAMPLE_RATE, channels=1, dtype="int16")
+    sd.wait()
+    return samples.tobytes()
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Build a labelled corpus of Daily Routine answers.")
+    parser.add_argument("mode", choices=["import", "record", "list"])
+    parser.add_argument("level", type=int, nargs="?")
+    parser.add_argument("answer", nargs="?")
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=RECORD_SECONDS)
+    args = parser.parse_args(argv)
+    if args.mode == "list":
+        entries = load_corpus(args.corpus)
+        counts = {}
+        for entry in entries:
+            key = (entry["level"], entry["answer"])
+            counts[key] = counts.get(key, 0) + 1
+        for (level, answer), count in sorted(counts.items()):
+            print(f"level {level:>3}  {answer or '(neither)':<16} {count:>4}")
+        print(f"{len(entries)} recordings in '{args.corpus}'")
+        return
+    if args.level is None or args.answer is None:
+        parser.error(f"{args.mode} needs LEVEL and ANSWER (use '' for neither answer)")
+    check_label(args.level, args.answer.lower())
+    if args.mode == "import":
+        for path in args.paths:
+            print(f"  - {add_recording(args.corpus, args.level, args.answer.lower(), read_pcm(path))}")
+        return
+    prompt = load_levels()[args.level]["prompt"]
+    for take in range(args.count):
+        input(f"[{take + 1}/{args.count}] {prompt} - say '{args.answer}'. Press Enter to start recording...")
+        print(f"  - {add_recording(args.corpus, args.level, args.answer.lower(), record(args.seconds))}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
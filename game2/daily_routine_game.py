@@ -1,112 +1,182 @@
 import pygame
-import sounddevice as sd
-from vosk import Model, KaldiRecognizer
-import queue
-import json
-import os
 import threading
 import time
+from engine.capture import DROP_WHILE_PLAYING, MicrophoneCapture
+from engine.audio_bus import get_bus
+from engine import telemetry
+from engine.scene import Scene
+from game2 import model_cache, recognition_worker
+from game2.levels import load_levels
+from game2.grammar import AnswerDecoder
+from game2.session import judge
+from game2.voice_cache import VoiceLineCache
 
-class DailyRoutineGame:
-    def __init__(self, screen):
+# Microphone block size; smaller blocks mean earlier partial results
+CAPTURE_BLOCK_MS = 50
+# How long the game-over text stays up before returning to the menu
+GAME_OVER_SECONDS = 3
+
+class DailyRoutineGame(Scene):
+    name = "daily_routine"
+
+    def __init__(self, screen, voice_lines=None):
+        super().__init__()
         self.screen = screen
         self.WIDTH, self.HEIGHT = self.screen.get_size()
-        self.FONT = pygame.font.SysFont(None, 36)
-        self.clock = pygame.time.Clock()
-        self.model = Model("game2/model")
-        self.recognizer = KaldiRecognizer(self.model, 16000)
-        self.q = queue.Queue()
+        # The default font; SysFont(None) would resolve the same font after scanning the system's fonts
+        self.FONT = pygame.font.Font(None, 36)
+        self.audio = get_bus()
         self.current_text = "Welcome!"
         self.current_level = 0
         self.level_done = False
         self.wait_time = 3
         self.last_transition = time.time()
         self.running = True
+        self.game_over_at = None
+        # (how the answer was decided, seconds from first partial word to decision)
+        self.decision_latencies = []
+        self.levels = load_levels()
+        # The launcher hands over a cache its warm-up already started filling
+        self.voice_lines = voice_lines if voice_lines is not None else VoiceLineCache(self.levels)
+        self.voice_lines.prefetch(0)
 
-        self.levels = [
-            {"prompt": "Say 'wake up' or 'sleep more'", "correct": "wake up", "success": "Good morning! You woke up on time.", "fail": "You can't sleep more. Let's wake up now."},
-            {"prompt": "Say 'brush' or 'play'", "correct": "brush", "success": "Nice! Brushing keeps teeth healthy.", "fail": "No play now. First, let's brush."},
-            {"prompt": "Say 'bath' or 'mobile'", "correct": "bath", "success": "Refreshing! Bath time it is.", "fail": "No mobile now. Take a bath."},
-            {"prompt": "Say 'uniform' or 'pajamas'", "correct": "uniform", "success": "Perfect! Let's wear the uniform.", "fail": "No pajamas now. Wear uniform."},
-            {"prompt": "Say 'breakfast' or 'chips'", "correct": "breakfast", "success": "Healthy breakfast! Well done.", "fail": "Not chips now. Have breakfast."},
-            {"prompt": "Say 'school bag' or 'video game'", "correct": "school bag", "success": "Great! Packing the school bag.", "fail": "No video games now. Pick school bag."},
-            {"prompt": "Say 'bus stop' or 'TV'", "correct": "bus stop", "success": "Smart! Heading to bus stop.", "fail": "No TV now. Go to bus stop."},
-            {"prompt": "Say 'greet teacher' or 'run'", "correct": "greet teacher", "success": "Nice manners! Greeted the teacher.", "fail": "No running. Greet your teacher."},
-            {"prompt": "Say 'attend class' or 'sleep'", "correct": "attend class", "success": "Focused! Attending class now.", "fail": "No sleeping. Attend your class."},
-            {"prompt": "Say 'lunch' or 'candy'", "correct": "lunch", "success": "Healthy lunch time!", "fail": "No candy now. Have lunch."},
-            {"prompt": "Say 'playground' or 'canteen'", "correct": "playground", "success": "Great! Recess fun in playground.", "fail": "No canteen today. Let's play."},
-            {"prompt": "Say 'say bye' or 'throw bag'", "correct": "say bye", "success": "Polite! You said bye to friends.", "fail": "Don't throw bag! Say bye nicely."},
-            {"prompt": "Say 'homework' or 'cartoon'", "correct": "homework", "success": "Responsible! Starting homework.", "fail": "No cartoon now. Do homework."},
-            {"prompt": "Say 'dinner' or 'ice cream'", "correct": "dinner", "success": "Yum! Time for dinner.", "fail": "No ice cream now. Have dinner."},
-            {"prompt": "Say 'sleep' or 'mobile'", "correct": "sleep", "success": "Good night! Sweet dreams.", "fail": "No mobile now. Time to sleep."},
-        ]
-
-        threading.Thread(target=self.listen, daemon=True).start()
-
-    def audio_callback(self, indata, frames, time, status):
-        self.q.put(bytes(indata))
+        if recognition_worker.ENABLED:
+            # Decoding happens in the worker process; the capture callback writes
+            # straight into its shared ring and update() polls for answers
+            self.worker = recognition_worker.get_worker()
+            self.worker.drain()
+            self.capture = MicrophoneCapture(block_ms=CAPTURE_BLOCK_MS, ring=self.worker.ring)
+            self.capture.playing = False
+            self.decoder = None
+        else:
+            self.worker = None
+            self.model = model_cache.get_model()
+            self.recognizer = model_cache.acquire_recognizer()
+            self.decoder = AnswerDecoder(self.recognizer, self.levels)
+            # The game's own prompts are not fed to the recognizer
+            self.capture = MicrophoneCapture(block_ms=CAPTURE_BLOCK_MS, policy=DROP_WHILE_PLAYING)
 
     def listen(self):
-        with sd.RawInputStream(samplerate=16000, blocksize=8000, dtype='int16', channels=1, callback=self.audio_callback):
-            while self.running:
-                data = self.q.get()
-                if self.recognizer.AcceptWaveform(data):
-                    result = json.loads(self.recognizer.Result())
-                    text = result.get("text", "").lower()
-                    if text:
-                        print("Heard:", text)
-                        self.handle_command(text)
-
-    def load_sound(self, file):
-        return pygame.mixer.Sound(file)
+        decoder = self.decoder
+        try:
+            with self.capture:
+                while self.running:
+                    data = self.capture.read(timeout=0.5)
+                    if data is None:
+                        continue
+                    # Only the two answers of the current level (plus [unk]) are decodable
+                    if decoder.level != self.current_level and self.current_level < len(self.levels):
+                        decoder.set_level(self.current_level)
+                    # Once answered, the rest of the utterance is decoded but ignored
+                    answer = decoder.accept(data, listening=not self.level_done)
+                    if answer is not None:
+                        self.commit_answer(*answer, accepted_at=decoder.accepted_at)
+        finally:
+            # Only this thread touches the recognizer, so it hands it back
+            model_cache.release_recognizer(self.recognizer)
+
+    def poll_worker(self):
+        """Process mode: keeps the worker on the current level and applies its answer, without blocking."""
+        if self.current_level >= len(self.levels):
+            return
+        self.worker.set_level(self.current_level, not self.level_done)
+        result = self.worker.poll()
+        if result is not None:
+            level, text, mode, heard_at, accepted_at = result
+            if level == self.current_level and not self.level_done:
+                self.commit_answer(text, mode, heard_at, accepted_at)
+
+    def commit_answer(self, text, mode, heard_at, accepted_at=None):
+        latency = time.time() - heard_at if heard_at is not None else 0.0
+        self.decision_latencies.append((mode, latency))
+        print(f"Heard: {text} ({mode} result, {latency * 1000:.0f} ms after first word)")
+        if accepted_at is not None:
+            telemetry.record("accept_to_command_ms", (time.time() - accepted_at) * 1000)
+        self.handle_command(text)
 
     def play_audio(self, level_index, category):
-        filename = f"game2/voice_lines/{category}_level{level_index}.ogg"
-        if os.path.exists(filename):
-            pygame.mixer.stop()
-            sound = self.load_sound(filename)
-            sound.play()
-            while pygame.mixer.get_busy():
-                pygame.time.wait(100)
+        sound = self.voice_lines.get(level_index, category)
+        if category == "prompt":
+            # While the prompt plays, decode whatever can come next
+            self.voice_lines.prefetch(level_index)
+        if sound is not None:
+            # Returns straight away; voice_finished runs from the channel's end event.
+            # The prompts lane holds launcher speech instead of stopping the whole mixer.
+            self.capture.playing = True
+            self.audio.play("prompts", sound)
+            self.audio.when_idle("prompts", self.voice_finished)
+
+    def voice_finished(self):
+        self.capture.playing = False
+        if self.level_done:
+            # The result stays on screen for wait_time after its voice line ends
+            self.last_transition = time.time()
+
+    def recognition_stats(self):
+        """Decoder counters (audio skipped by the voice activity gate, decode CPU saved) plus
+        the blocks capture dropped while the game was speaking."""
+        stats = dict(self.worker.decoder_stats if self.worker is not None else self.decoder.stats())
+        stats["dropped_while_prompting"] = self.capture.stats()["dropped"]
+        return stats
 
     def handle_command(self, cmd):
-        level = self.levels[self.current_level]
-        if level["correct"] in cmd:
-            self.current_text = level["success"]
-            self.play_audio(self.current_level, "success")
-        else:
-            self.current_text = level["fail"]
-            self.play_audio(self.current_level, "fail")
+        result, self.current_text = judge(self.levels[self.current_level], cmd)
+        self.play_audio(self.current_level, result)
         self.level_done = True
         self.last_transition = time.time()
 
-    def run(self):
-        while self.running:
-            self.screen.fill((0, 0, 50))
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-            display_text = self.levels[self.current_level]["prompt"] if not self.level_done else self.current_text
-            text_surface = self.FONT.render(display_text, True, (255, 255, 255))
-            self.screen.blit(text_surface, (self.WIDTH // 2 - text_surface.get_width() // 2, self.HEIGHT // 2))
-            pygame.display.flip()
-            self.clock.tick(30)
-
-            if self.level_done is False:
-                self.play_audio(self.current_level, "prompt")
-                self.level_done = None
-
-            if self.level_done and (time.time() - self.last_transition > self.wait_time):
-                self.current_level += 1
-                if self.current_level >= len(self.levels):
-                    self.current_text = "Game Over! You did great."
-                    print(self.current_text)
-                    time.sleep(3)
-                    self.running = False
-                else:
-                    self.current_text = ""
-                    self.level_done = False
-
-        pygame.quit()
\ No newline at end of file
+    # --- Scene hooks ---
+    def enter(self):
+        # The menu's announcements would play between the prompts, and be heard as answers
+        self.audio.stop("speech")
+        if self.worker is not None:
+            self.capture.start()
+        else:
+            threading.Thread(target=self.listen, daemon=True).start()
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+            self.audio.stop("prompts")
+            self.running = False
+            self.finish()
+
+    def update(self):
+        if self.game_over_at is not None:
+            if time.time() - self.game_over_at > GAME_OVER_SECONDS:
+                self.running = False
+                self.finish()
+            return
+
+        if self.worker is not None:
+            self.poll_worker()
+
+        if self.level_done and not self.audio.busy("prompts") and (time.time() - self.last_transition > self.wait_time):
+            self.current_level += 1
+            if self.current_level >= len(self.levels):
+                self.current_text = "Game Over! You did great."
+                print(self.current_text)
+                self.game_over_at = time.time()
+            else:
+                self.current_text = ""
+                self.level_done = False
+
+    def render(self, screen):
+        screen.fill((0, 0, 50))
+        display_text = self.levels[self.current_level]["prompt"] if not self.level_done else self.current_text
+        text_surface = self.FONT.render(display_text, True, (255, 255, 255))
+        screen.blit(text_surface, (self.WIDTH // 2 - text_surface.get_width() // 2, self.HEIGHT // 2))
+        pygame.display.flip()
+
+        # A new level's prompt starts as soon as its text is on screen, not a frame later
+        if self.level_done is False:
+            self.play_audio(self.current_level, "prompt")
+            self.level_done = None
+
+    def exit(self):
+        # The listen thread sees this and closes the microphone itself
+        self.running = False
+        if self.worker is not None:
+            self.capture.stop()
+        print(f"Voice line cache: {self.voice_lines.stats()}")
+        print(f"Recognition: {self.recognition_stats()}")
+        self.voice_lines.close()
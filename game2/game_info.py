@@ -0,0 +1,41 @@
+# Launcher metadata for Daily Routine Adventure (see engine/game_registry.py).
+# Game code is only imported by warm_up() and create().
+from engine.game_registry import LOADING_PHRASE
+from game2 import model_cache, recognition_worker
+
+LABEL = "Daily Routine Adventure"
+ERROR_PHRASE = "Error starting game. Please check model files and dependencies."
+PHRASES = [LOADING_PHRASE, ERROR_PHRASE]
+
+# Voice lines decoded by the last warm-up, handed to the next game created
+_voice_lines = None
+
+def speech_model():
+    """Where the speech model is loaded: this process, or the recognition worker."""
+    return recognition_worker if recognition_worker.ENABLED else model_cache
+
+def warm_up(speech):
+    global _voice_lines
+    speech_model().start_loading()
+    from game2 import daily_routine_game
+    from game2.levels import load_levels
+    from game2.voice_cache import VoiceLineCache
+    voice_lines = VoiceLineCache(load_levels())
+    voice_lines.prefetch(0)
+    if _voice_lines is not None:
+        _voice_lines.close() # From a warm-up no game was created after
+    _voice_lines = voice_lines
+
+def unavailable():
+    status = speech_model().status()
+    if status in (model_cache.IDLE, model_cache.LOADING):
+        return LOADING_PHRASE
+    if status == model_cache.FAILED:
+        return ERROR_PHRASE
+    return None
+
+def create(screen, speech):
+    global _voice_lines
+    from game2.daily_routine_game import DailyRoutineGame
+    voice_lines, _voice_lines = _voice_lines, None
+    return DailyRoutineGame(screen, voice_lines=voice_lines)
@@ -0,0 +1,130 @@
+import re
+import json
+import time
+from game2.model_cache import SAMPLE_RATE
+
+try:
+    from engine.vad import VoiceActivityGate
+except ImportError:
+    VoiceActivityGate = None
+
+# Each level accepts exactly two spoken answers, quoted in its prompt
+# ("Say 'wake up' or 'sleep more'"). Restricting the recognizer to those
+# phrases keeps decoding cheap and lets us commit on partial results.
+UNKNOWN_WORD = "[unk]"
+
+def level_options(level):
+    """The answers a level accepts, lower-cased, correct answer first.
+    Levels without an "answers" list take them from the quotes in the prompt."""
+    if "answers" in level:
+        options = [option.lower() for option in level["answers"]]
+    else:
+        options = [option.lower() for option in re.findall(r"'([^']+)'", level["prompt"])]
+    correct = level["correct"].lower()
+    if correct in options:
+        options.remove(correct)
+    return [correct] + options
+
+def level_grammar(level):
+    """JSON grammar for KaldiRecognizer: the level's phrases plus [unk]."""
+    return json.dumps(level_options(level) + [UNKNOWN_WORD])
+
+def decide(text, options):
+    """Returns the single option heard in `text`, or None if zero or several match."""
+    matched = [option for option in options if re.search(rf"\b{re.escape(option)}\b", text)]
+    if len(matched) == 1:
+        return matched[0]
+    return None
+
+def decide_partial(text, options):
+    """
+    Like decide(), but only commits when no other option could still be
+    completed by the words that follow ("sleep" could become "sleep more").
+    """
+    option = decide(text, options)
+    if option is None:
+        return None
+    for other in options:
+        if other != option and other.startswith(option + " "):
+            return None
+    return option
+
+class AnswerDecoder:
+    """
+    Runs a recognizer against one level's grammar at a time and reports the
+    answer as soon as it is decided. Used by the in-process listener thread
+    and by the recognition worker process.
+
+    With vad=True (and NumPy installed) audio passes through a
+    VoiceActivityGate first, so silence is never decoded. The counters
+    behind stats() measure the audio skipped and the decode CPU it saved.
+    """
+    def __init__(self, recognizer, levels, vad=True):
+        self.recognizer = recognizer
+        self.levels = levels
+        self.level = None
+        self.options = []
+        self.heard_at = None
+        # When the block that produced the last answer reached the recognizer
+        self.accepted_at = None
+        self.gate = VoiceActivityGate() if vad and VoiceActivityGate is not None else None
+        self.seconds_decoded = 0.0
+        self.decode_cpu = 0.0
+
+    def set_level(self, index, grammar=True):
+        """Restricts decoding to level `index`'s answers (plus [unk]). With
+        grammar=False the recognizer keeps its open vocabulary and only the
+        answers are matched."""
+        self.level = index
+        self.options = level_options(self.levels[index])
+        if grammar:
+            # After an answer the rest of the utterance is still fed in, leaving the
+            # recognizer mid-decode; libvosk aborts on SetGrammar in that state
+            self.recognizer.Reset()
+            self.recognizer.SetGrammar(level_grammar(self.levels[index]))
+        self.heard_at = None
+        if self.gate is not None:
+            self.gate.reset()
+
+    def accept(self, data, listening=True):
+        """
+        Feeds one block of audio. Returns (text, mode, heard_at) once an answer
+        is decided, else None. With listening=False the audio is decoded but
+        nothing is reported (the level was already answered).
+        """
+        if self.gate is not None:
+            data = self.gate.admit(data)
+            if data is None:
+                return None
+        self.accepted_at = time.time()
+        start = time.thread_time()
+        final = self.recognizer.AcceptWaveform(data)
+        self.decode_cpu += time.thread_time() - start
+        self.seconds_decoded += len(data) / (2 * SAMPLE_RATE)
+        if not listening:
+            self.heard_at = None
+            return None
+        if final:
+            text = json.loads(self.recognizer.Result()).get("text", "").lower()
+            text = text.replace(UNKNOWN_WORD, "").strip()
+            heard_at, self.heard_at = self.heard_at, None
+            return (text, "final", heard_at) if text else None
+        partial = json.loads(self.recognizer.PartialResult()).get("partial", "").lower()
+        if partial and self.heard_at is None:
+            self.heard_at = time.time()
+        if decide_partial(partial, self.options):
+            # Commit without waiting for endpointing, then drop the rest of the utterance
+            self.recognizer.Reset()
+            heard_at, self.heard_at = self.heard_at, None
+            return (partial, "partial", heard_at)
+        return None
+
+    def stats(self):
+        """Audio seen and decoded, the fraction the gate skipped and the decode CPU that saved (estimated
+        from the CPU cost of the audio that was decoded)."""
+        seconds_in = self.gate.seconds_in if self.gate is not None else self.seconds_decoded
+        skipped = self.gate.skipped_fraction if self.gate is not None else 0.0
+        cpu_per_second = self.decode_cpu / self.seconds_decoded if self.seconds_decoded else 0.0
+        return {"audio_s": round(seconds_in, 2), "decoded_s": round(self.seconds_decoded, 2),
+                "skipped_fraction": round(skipped, 3), "decode_cpu_s": round(self.decode_cpu, 3),
+                "cpu_saved_s": round(seconds_in * skipped * cpu_per_second, 3)}
@@ -0,0 +1,141 @@
+import mmap
+import json
+import struct
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+# Layout: fixed header, one UTF-8 JSON record per level, a fixed-width index
+# of (offset, length) per level, then a JSON table of theme -> level ranges.
+# Opening a pack reads only the header; a level is found by reading its index
+# entry, so startup cost and memory do not grow with the number of levels.
+LEVEL_PACK_MAGIC = b"BGLV"
+LEVEL_PACK_VERSION = 1
+HEADER_FORMAT = "<4sHIQQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+INDEX_FORMAT = "<QI"
+INDEX_SIZE = struct.calcsize(INDEX_FORMAT)
+CACHE_SIZE = 16
+
+def write_level_pack(path, levels):
+    """
+    Writes a level pack. `levels` is any iterable of level dicts, consumed
+    once, so packs larger than memory can be streamed in. Levels with a
+    "theme" are indexed under it. Returns the number of levels written.
+    """
+    index = []
+    themes = {}
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER_SIZE)
+        for number, level in enumerate(levels):
+            record = json.dumps(level, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            index.append(struct.pack(INDEX_FORMAT, f.tell(), len(record)))
+            f.write(record)
+            ranges = themes.setdefault(level.get("theme", ""), [])
+            # Stored as [first, count] runs, since themed levels are usually contiguous
+            if ranges and ranges[-1][0] + ranges[-1][1] == number:
+                ranges[-1][1] += 1
+            else:
+                ranges.append([number, 1])
+        index_offset = f.tell()
+        f.write(b"".join(index))
+        themes_offset = f.tell()
+        themes_bytes = json.dumps(themes, sort_keys=True).encode("utf-8")
+        f.write(themes_bytes)
+        f.seek(0)
+        f.write(struct.pack(HEADER_FORMAT, LEVEL_PACK_MAGIC, LEVEL_PACK_VERSION, len(index),
+                            index_offset, themes_offset, len(themes_bytes)))
+    return len(index)
+
+class LevelPack:
+    """
+    Read-only, memory-mapped sequence of levels built by build_level_pack.py.
+    Levels are decoded on access; only the last CACHE_SIZE are kept.
+    One pack is shared by every thread that reads levels, so the cache is locked.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self._index_offset, self._themes_offset, self._themes_length = \
+            struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        if magic != LEVEL_PACK_MAGIC or version != LEVEL_PACK_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {LEVEL_PACK_VERSION} level pack")
+        self._themes = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, number):
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError(f"level {number} out of range")
+        with self._lock:
+            level = self._cache.get(number)
+            if level is not None:
+                self._cache.move_to_end(number)
+                return level
+        offset, length = struct.unpack_from(INDEX_FORMAT, self._map, self._index_offset + number * INDEX_SIZE)
+        level = json.loads(self._map[offset:offset + length])
+        with self._lock:
+            # Another thread may have decoded it meanwhile; either copy will do
+            self._cache[number] = level
+            self._cache.move_to_end(number)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return level
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self[number]
+
+    def themes(self):
+        """Names of every theme in the pack (read on first use)."""
+        return list(self._theme_table())
+
+    def theme(self, name):
+        """The levels of one theme, as a lazy sequence in pack order."""
+        return LevelView(self, self._theme_table()[name])
+
+    def _theme_table(self):
+        if self._themes is None:
+            start = self._themes_offset
+            self._themes = json.loads(self._map[start:start + self._themes_length])
+        return self._themes
+
+    def close(self):
+        with self._lock:
+            self._cache.clear()
+        self._map.close()
+
+class LevelView:
+    """A sequence over some runs of a LevelPack's levels, e.g. one theme."""
+    def __init__(self, pack, ranges):
+        self.pack = pack
+        self.ranges = ranges
+        self._starts = []
+        total = 0
+        for _, count in ranges:
+            self._starts.append(total)
+            total += count
+        self.count = total
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, number):
+        if number < 0:
+            number += self.count
+        if not 0 <= number < self.count:
+            raise IndexError(f"level {number} out of range")
+        run = bisect_right(self._starts, number) - 1
+        first, _ = self.ranges[run]
+        return self.pack[first + number - self._starts[run]]
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self[number]
@@ -0,0 +1,22 @@
+import os
+from game2.level_pack import LevelPack
+
+# Levels live in game2/content/daily_routine.jsonl (one level per line: the
+# prompt, accepted answers, correct answer, both responses, its theme and the
+# audio pack names of its voice lines). build_level_pack.py compiles that
+# into the indexed pack the games read.
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+LEVEL_SOURCE_PATH = os.path.join(CONTENT_DIR, "daily_routine.jsonl")
+LEVEL_PACK_PATH = os.path.join(CONTENT_DIR, "daily_routine.levels")
+
+_packs = {}
+
+def load_levels(path=LEVEL_PACK_PATH, theme=None):
+    """
+    The levels of a pack (all of them, or one theme) as a lazy sequence.
+    The pack stays open and is shared by every caller.
+    """
+    if path not in _packs:
+        _packs[path] = LevelPack(path)
+    pack = _packs[path]
+    return pack if theme is None else pack.theme(theme)
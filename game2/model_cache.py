@@ -0,0 +1,104 @@
+import os
+import json
+import threading
+
+# Process-wide Vosk model cache. The model is loaded once on a background
+# thread and shared by every DailyRoutineGame session; recognizers are pooled
+# and Reset() between sessions instead of being rebuilt.
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODEL = "model"
+# Written by benchmarks/bench_models.py --save: the fastest model that met the accuracy threshold
+MODEL_CHOICE_PATH = os.path.join(GAME_DIR, "model_choice.json")
+
+def chosen_model_path():
+    """The model folder named in model_choice.json, or the default model."""
+    name = DEFAULT_MODEL
+    try:
+        with open(MODEL_CHOICE_PATH, encoding="utf-8") as f:
+            name = json.load(f).get("model", DEFAULT_MODEL)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable '{os.path.basename(MODEL_CHOICE_PATH)}': {e}")
+    path = os.path.join(GAME_DIR, name)
+    if not os.path.isdir(path):
+        print(f"Warning: Chosen speech model '{name}' not found, using '{DEFAULT_MODEL}'")
+        path = os.path.join(GAME_DIR, DEFAULT_MODEL)
+    return path
+
+MODEL_PATH = chosen_model_path()
+SAMPLE_RATE = 16000
+POOL_SIZE = 2
+
+IDLE, LOADING, READY, FAILED = "idle", "loading", "ready", "failed"
+
+_lock = threading.Lock()
+_loaded = threading.Event()
+_state = IDLE
+_model = None
+_error = None
+_pool = []
+_listeners = []
+
+def start_loading(path=MODEL_PATH):
+    """Starts loading the model in the background. Safe to call more than once."""
+    global _state
+    with _lock:
+        if _state != IDLE:
+            return
+        _state = LOADING
+    threading.Thread(target=_load, args=(path,), daemon=True).start()
+
+def _load(path):
+    global _state, _model, _error
+    try:
+        from vosk import Model
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"Vosk model not found at '{path}'")
+        model = Model(path)
+    except Exception as e:
+        print(f"Could not load speech model: {e}")
+        with _lock:
+            _error = e
+            _state = FAILED
+    else:
+        with _lock:
+            _model = model
+            _state = READY
+    _loaded.set()
+    for callback in list(_listeners):
+        callback()
+
+def add_listener(callback):
+    """Calls `callback` (from the loading thread) once loading finishes or fails."""
+    _listeners.append(callback)
+
+def status():
+    """One of 'idle', 'loading', 'ready' or 'failed'."""
+    return _state
+
+def get_model(timeout=None):
+    """Returns the shared model, loading it first if nobody has started it yet.
+    Re-raises the load error if loading failed."""
+    start_loading()
+    if not _loaded.wait(timeout):
+        raise TimeoutError("Speech model is still loading")
+    if _state == FAILED:
+        raise _error
+    return _model
+
+def acquire_recognizer():
+    """Takes a recognizer from the pool, or builds one for the shared model."""
+    model = get_model()
+    with _lock:
+        if _pool:
+            return _pool.pop()
+    from vosk import KaldiRecognizer
+    return KaldiRecognizer(model, SAMPLE_RATE)
+
+def release_recognizer(recognizer):
+    """Resets a recognizer and returns it to the pool for the next session."""
+    recognizer.Reset()
+    with _lock:
+        if len(_pool) < POOL_SIZE:
+            _pool.append(recognizer)
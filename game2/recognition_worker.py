@@ -0,0 +1,195 @@
+import os
+import queue
+import atexit
+import threading
+import multiprocessing
+
+from engine.shared_ring import SharedAudioRing
+from game2.model_cache import FAILED, IDLE, LOADING, MODEL_PATH, READY, SAMPLE_RATE
+
+# Optional out-of-process recognition. With BLINDGAME_RECOGNITION=process the
+# Vosk model and decoder live in a worker process, so decode passes never hold
+# the GIL the render loop needs. The game process still owns the microphone;
+# its capture callback copies each block into a SharedAudioRing, and answers
+# come back over a pipe. The worker outlives each DailyRoutineGame session.
+ENABLED = os.environ.get("BLINDGAME_RECOGNITION", "thread") == "process"
+RING_SECONDS = 2
+READ_BYTES = SAMPLE_RATE * 2 // 20 # 50 ms of 16-bit mono
+
+# --- Worker process ---
+def worker_main(ring_name, ring_capacity, model_path, control, results):
+    """Entry point of the worker process. Runs until it is sent ("stop",). ("reset",) starts
+    a new session: queued audio and whatever the decoder had heard are dropped."""
+    try:
+        from vosk import Model, KaldiRecognizer
+        if not os.path.isdir(model_path):
+            raise FileNotFoundError(f"Vosk model not found at '{model_path}'")
+        model = Model(model_path)
+    except Exception as e:
+        results.send(("failed", e))
+        return
+    from game2.levels import load_levels
+    from game2.grammar import AnswerDecoder
+    ring = SharedAudioRing(ring_capacity, name=ring_name)
+    decoder = AnswerDecoder(KaldiRecognizer(model, SAMPLE_RATE), load_levels())
+    listening = False
+    results.send(("ready",))
+    try:
+        while True:
+            while control.poll():
+                message = control.recv()
+                if message[0] == "stop":
+                    return
+                if message[0] == "reset":
+                    # The next level message sets the decoder up again, even for the same level
+                    ring.discard()
+                    decoder.level = None
+                    listening = False
+                    results.send(("reset",))
+                    continue
+                _, level, listening = message
+                if level != decoder.level:
+                    # Audio from the previous level cannot answer this one
+                    ring.discard()
+                    decoder.set_level(level)
+            data = ring.read(READ_BYTES, timeout=0.1)
+            if data is None or decoder.level is None:
+                continue
+            answer = decoder.accept(data, listening)
+            if answer is not None:
+                listening = False
+                results.send(("result", decoder.level) + answer + (decoder.accepted_at,))
+                results.send(("stats", decoder.stats()))
+    finally:
+        ring.close()
+
+# --- Game process side ---
+class RecognitionWorker:
+    """
+    Handle on the worker process. Results are collected by a reader thread,
+    so the game loop only ever calls the non-blocking poll().
+    """
+    def __init__(self, model_path=MODEL_PATH):
+        self.state = LOADING
+        self.error = None
+        self.ring = SharedAudioRing(SAMPLE_RATE * 2 * RING_SECONDS, drop_while_playing=True)
+        self.results = queue.Queue()
+        # The worker decoder's counters, as of its last answer
+        self.decoder_stats = {}
+        self._loaded = threading.Event()
+        self._level = None
+        # Set by drain() until the worker confirms the reset; results before that are stale
+        self._resetting = False
+        self._reset_lock = threading.Lock()
+        self._closing = False
+        context = multiprocessing.get_context("spawn")
+        # One-way pipes: Pipe(duplex=False) returns (receiving end, sending end)
+        worker_control, self._control = context.Pipe(duplex=False)
+        self._results, worker_results = context.Pipe(duplex=False)
+        self.process = context.Process(target=worker_main, daemon=True, name="recognition-worker",
+                                       args=(self.ring.name, self.ring.capacity, model_path,
+                                             worker_control, worker_results))
+        self.process.start()
+        worker_control.close()
+        worker_results.close()
+        threading.Thread(target=self._read_results, daemon=True).start()
+
+    def _read_results(self):
+        while True:
+            try:
+                message = self._results.recv()
+            except (EOFError, OSError):
+                if self._closing:
+                    return
+                message = ("failed", RuntimeError("Speech recognition worker exited"))
+            if message[0] == "result":
+                with self._reset_lock:
+                    if not self._resetting:
+                        self.results.put(message[1:])
+                continue
+            if message[0] == "reset":
+                with self._reset_lock:
+                    self._resetting = False
+                continue
+            if message[0] == "stats":
+                self.decoder_stats = message[1]
+                continue
+            self.state = READY if message[0] == "ready" else FAILED
+            if self.state == FAILED:
+                print(f"Speech recognition unavailable: {message[1]}")
+                self.error = message[1]
+            self._loaded.set()
+            for callback in list(_listeners):
+                callback()
+            if self.state == FAILED:
+                return
+
+    def set_level(self, level, listening):
+        """Tells the worker which level's answers to listen for. Cheap to call every frame."""
+        if (level, listening) != self._level and self.state == READY:
+            self._level = (level, listening)
+            self._control.send(("level", level, listening))
+
+    def poll(self):
+        """The next (level, text, mode, heard_at, accepted_at) result, or None. Never blocks."""
+        try:
+            return self.results.get_nowait()
+        except queue.Empty:
+            return None
+
+    def drain(self):
+        """Starts a new session: drops results left over from the previous one and has the
+        worker reset its decoder and audio ring, even if the new session starts on the same level."""
+        with self._reset_lock:
+            if self.state == READY:
+                self._resetting = True
+                self._control.send(("reset",))
+            while self.poll() is not None:
+                pass
+        self._level = None
+
+    def wait(self, timeout=None):
+        if not self._loaded.wait(timeout):
+            raise TimeoutError("Speech model is still loading")
+        if self.state == FAILED:
+            raise self.error
+
+    def shutdown(self):
+        self._closing = True
+        if self.process.is_alive():
+            try:
+                self._control.send(("stop",))
+            except OSError:
+                pass
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.ring.close()
+
+# --- Module interface (mirrors model_cache) ---
+_lock = threading.Lock()
+_worker = None
+_listeners = []
+
+def start_loading(path=MODEL_PATH):
+    """Starts the worker process, which loads the model. Safe to call more than once."""
+    global _worker
+    with _lock:
+        if _worker is None:
+            _worker = RecognitionWorker(path)
+            atexit.register(_worker.shutdown)
+    return _worker
+
+def add_listener(callback):
+    """Calls `callback` (from the reader thread) once the worker is ready or has failed."""
+    _listeners.append(callback)
+
+def status():
+    """One of 'idle', 'loading', 'ready' or 'failed'."""
+    return _worker.state if _worker is not None else IDLE
+
+def get_worker(timeout=None):
+    """Returns the running worker, starting it first if needed. Re-raises its load error."""
+    worker = start_loading()
+    worker.wait(timeout)
+    return worker
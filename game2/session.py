@@ -0,0 +1,65 @@
+import time
+from game2.levels import load_levels
+from game2.grammar import AnswerDecoder
+from game2.model_cache import SAMPLE_RATE
+
+# Audio ignored after an answer: the rest of that utterance, which would
+# otherwise be decoded against the next level's grammar
+ANSWER_HOLDOFF_SECONDS = 1.0
+
+def judge(level, text):
+    """("success" or "fail", the line to show) for the answer `text` to `level`."""
+    if level["correct"] in text:
+        return "success", level["success"]
+    return "fail", level["fail"]
+
+class RoutineSession:
+    """
+    One player's progress through Daily Routine Adventure, with no screen or
+    sound card attached: audio goes in through accept(), and each decided
+    answer comes out as an event dict for whatever front end is presenting
+    the game. After an answer the session moves straight on to the next
+    level; pacing the voice lines is the front end's job. The microphone is
+    expected to keep streaming, so the hold-off after an answer is counted in
+    audio rather than wall-clock time.
+    """
+    def __init__(self, session_id, recognizer, levels=None, holdoff_seconds=ANSWER_HOLDOFF_SECONDS):
+        self.id = session_id
+        self.levels = levels if levels is not None else load_levels()
+        self.decoder = AnswerDecoder(recognizer, self.levels)
+        self.holdoff_bytes = int(holdoff_seconds * SAMPLE_RATE * 2)
+        self.skip_bytes = 0
+        self.level = 0
+        self.finished = False
+        self.started_at = time.time()
+        self.decoder.set_level(0)
+
+    def prompt_event(self):
+        return {"event": "prompt", "session": self.id, "level": self.level,
+                "text": self.levels[self.level]["prompt"]}
+
+    def accept(self, data):
+        """Decodes one block of audio. Returns the events it caused (usually none)."""
+        if self.finished:
+            return []
+        if self.skip_bytes > 0:
+            self.skip_bytes -= len(data)
+            return []
+        answer = self.decoder.accept(data)
+        if answer is None:
+            return []
+        text, mode, heard_at = answer
+        result, line = judge(self.levels[self.level], text)
+        events = [{"event": "answer", "session": self.id, "level": self.level, "heard": text,
+                   "mode": mode, "result": result, "text": line,
+                   "decision_ms": (time.time() - heard_at) * 1000 if heard_at is not None else 0.0}]
+        self.level += 1
+        if self.level >= len(self.levels):
+            self.finished = True
+            events.append({"event": "finished", "session": self.id,
+                           "seconds": time.time() - self.started_at})
+        else:
+            self.decoder.set_level(self.level)
+            self.skip_bytes = self.holdoff_bytes
+            events.append(self.prompt_event())
+        return events
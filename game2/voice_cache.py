@@ -0,0 +1,114 @@
+import time
+import queue
+import threading
+import pygame
+from engine import telemetry
+from engine.audio_pack import asset_path, get_pack
+
+CATEGORIES = ("prompt", "success", "fail")
+
+class VoiceLineCache:
+    """
+    Decoded voice lines for the levels around the current one. While a
+    level's prompt plays, prefetch() decodes its success and fail lines and
+    the next level's prompt on a background thread, so the response to an
+    answer starts without any file I/O or decoding. Finished levels are
+    evicted as the game moves on.
+
+    Counters: a hit is a playback whose clip was already decoded; `saved_ms`
+    adds up what those clips took to decode in the background, and
+    `miss_ms` what the misses cost on the spot.
+    """
+    def __init__(self, levels):
+        self.levels = levels
+        self.pack = get_pack()
+        self._sounds = {}
+        self._decode_ms = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._queued = set()
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+        self.miss_ms = 0.0
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def _load(self, level_index, category):
+        """Decodes one voice line. Returns (sound or None, milliseconds taken)."""
+        start = time.perf_counter()
+        name = self.levels[level_index].get("audio", {}).get(category)
+        sound = None
+        try:
+            if name is not None and self.pack is not None and name in self.pack:
+                sound = self.pack.sound(name)
+            elif name is not None and asset_path(name) is not None:
+                sound = pygame.mixer.Sound(asset_path(name))
+        except pygame.error as e:
+            print(f"  - Error loading voice line '{name}': {e}")
+        elapsed = (time.perf_counter() - start) * 1000
+        telemetry.record("voice_line_load_ms", elapsed)
+        return sound, elapsed
+
+    def get(self, level_index, category):
+        """The clip for a level's prompt, success or fail line, or None if it has none."""
+        key = (level_index, category)
+        with self._lock:
+            if key in self._sounds:
+                self.hits += 1
+                self.saved_ms += self._decode_ms[key]
+                return self._sounds[key]
+        sound, elapsed = self._load(level_index, category)
+        with self._lock:
+            self.misses += 1
+            self.miss_ms += elapsed
+            self._sounds[key] = sound
+            self._decode_ms[key] = elapsed
+        return sound
+
+    def prefetch(self, level_index):
+        """Queues what can follow `level_index`'s prompt, and drops earlier levels."""
+        self.evict_before(level_index)
+        keys = [(level_index, "prompt"), (level_index, "success"), (level_index, "fail")]
+        if level_index + 1 < len(self.levels):
+            keys.append((level_index + 1, "prompt"))
+        with self._lock:
+            for key in keys:
+                if key not in self._sounds and key not in self._queued:
+                    self._queued.add(key)
+                    self._queue.put(key)
+
+    def evict_before(self, level_index):
+        with self._lock:
+            for key in [key for key in self._sounds if key[0] < level_index]:
+                del self._sounds[key]
+                del self._decode_ms[key]
+
+    def close(self):
+        """Stops the prefetch thread and drops the decoded clips. The counters are kept."""
+        self._queue.put(None)
+        with self._lock:
+            self._sounds.clear()
+            self._decode_ms.clear()
+
+    def _work(self):
+        while True:
+            key = self._queue.get()
+            if key is None:
+                return
+            with self._lock:
+                done = key in self._sounds
+            if not done:
+                sound, elapsed = self._load(*key)
+                with self._lock:
+                    self._sounds.setdefault(key, sound)
+                    self._decode_ms.setdefault(key, elapsed)
+            with self._lock:
+                self._queued.discard(key)
+
+    def stats(self):
+        """Hit rate and per-playback latency saved by prefetching, in milliseconds."""
+        playbacks = self.hits + self.misses
+        return {"playbacks": playbacks, "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / playbacks if playbacks else None,
+                "saved_ms_per_playback": self.saved_ms / playbacks if playbacks else 0.0,
+                "miss_ms_per_playback": self.miss_ms / playbacks if playbacks else 0.0}
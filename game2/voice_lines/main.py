@@ -1,12 +1,18 @@
 import pygame
-import sounddevice as sd
 from vosk import Model, KaldiRecognizer
-import queue
 import json
 import os
+import sys
 import threading
 import time
 
+# Shared capture layer lives at the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from engine.capture import MicrophoneCapture
+from engine.audio_bus import get_bus
+from engine.audio_pack import asset_path
+from game2.levels import load_levels
+
 # ------------ Setup Vosk Model ----------------
 if not os.path.exists("model"):
     print("Please download a model from https://alphacephei.com/vosk/models and unzip into 'model'")
@@ -14,16 +20,12 @@ if not os.path.exists("model"):
 
 model = Model("model")
 recognizer = KaldiRecognizer(model, 16000)
-q = queue.Queue()
-
-def audio_callback(indata, frames, time, status):
-    q.put(bytes(indata))
+capture = MicrophoneCapture(block_ms=50)
 
 def listen():
-    with sd.RawInputStream(samplerate=16000, blocksize=8000, dtype='int16',
-                           channels=1, callback=audio_callback):
+    with capture:
         while True:
-            data = q.get()
+            data = capture.read()
             if recognizer.AcceptWaveform(data):
                 result = json.loads(recognizer.Result())
                 text = result.get("text", "").lower()
@@ -40,108 +42,17 @@ FONT = pygame.font.SysFont(None, 36)
 clock = pygame.time.Clock()
 
 # ------------ Game Levels -----------------------
-levels = [
-    {
-        "prompt": "Say 'wake up' or 'sleep more'",
-        "correct": "wake up",
-        "success": "Good morning! You woke up on time.",
-        "fail": "You can't sleep more. Let's wake up now.",
-    },
-    {
-        "prompt": "Say 'brush' or 'play'",
-        "correct": "brush",
-        "success": "Nice! Brushing keeps teeth healthy.",
-        "fail": "No play now. First, let's brush.",
-    },
-    {
-        "prompt": "Say 'bath' or 'mobile'",
-        "correct": "bath",
-        "success": "Refreshing! Bath time it is.",
-        "fail": "No mobile now. Take a bath.",
-    },
-    {
-        "prompt": "Say 'uniform' or 'pajamas'",
-        "correct": "uniform",
-        "success": "Perfect! Let's wear the uniform.",
-        "fail": "No pajamas now. Wear uniform.",
-    },
-    {
-        "prompt": "Say 'breakfast' or 'chips'",
-        "correct": "breakfast",
-        "success": "Healthy breakfast! Well done.",
-        "fail": "Not chips now. Have breakfast.",
-    },
-    {
-        "prompt": "Say 'school bag' or 'video game'",
-        "correct": "school bag",
-        "success": "Great! Packing the school bag.",
-        "fail": "No video games now. Pick school bag.",
-    },
-    {
-        "prompt": "Say 'bus stop' or 'TV'",
-        "correct": "bus stop",
-        "success": "Smart! Heading to bus stop.",
-        "fail": "No TV now. Go to bus stop.",
-    },
-    {
-        "prompt": "Say 'greet teacher' or 'run'",
-        "correct": "greet teacher",
-        "success": "Nice manners! Greeted the teacher.",
-        "fail": "No running. Greet your teacher.",
-    },
-    {
-        "prompt": "Say 'attend class' or 'sleep'",
-        "correct": "attend class",
-        "success": "Focused! Attending class now.",
-        "fail": "No sleeping. Attend your class.",
-    },
-    {
-        "prompt": "Say 'lunch' or 'candy'",
-        "correct": "lunch",
-        "success": "Healthy lunch time!",
-        "fail": "No candy now. Have lunch.",
-    },
-    {
-        "prompt": "Say 'playground' or 'canteen'",
-        "correct": "playground",
-        "success": "Great! Recess fun in playground.",
-        "fail": "No canteen today. Let's play.",
-    },
-    {
-        "prompt": "Say 'say bye' or 'throw bag'",
-        "correct": "say bye",
-        "success": "Polite! You said bye to friends.",
-        "fail": "Don't throw bag! Say bye nicely.",
-    },
-    {
-        "prompt": "Say 'homework' or 'cartoon'",
-        "correct": "homework",
-        "success": "Responsible! Starting homework.",
-        "fail": "No cartoon now. Do homework.",
-    },
-    {
-        "prompt": "Say 'dinner' or 'ice cream'",
-        "correct": "dinner",
-        "success": "Yum! Time for dinner.",
-        "fail": "No ice cream now. Have dinner.",
-    },
-    {
-        "prompt": "Say 'sleep' or 'mobile'",
-        "correct": "sleep",
-        "success": "Good night! Sweet dreams.",
-        "fail": "No mobile now. Time to sleep.",
-    }
-]
+levels = load_levels()
 
 
 def load_sound(file):
     return pygame.mixer.Sound(file)
 
 def play_audio(level_index, category):  # category: prompt/success/fail
-    filename = f"voice_lines/{category}_level{level_index}.ogg"
-    if os.path.exists(filename):
+    filename = asset_path(levels[level_index]["audio"][category])
+    if filename is not None:
         sound = load_sound(filename)
-        sound.play()
+        get_bus().play("prompts", sound)
 
 # ------------ Game State ------------------------
 current_text = "Welcome!"
@@ -173,6 +84,8 @@ while running:
     screen.fill((0, 0, 50))
     
     for event in pygame.event.get():
+        if get_bus().handle_event(event):
+            continue
         if event.type == pygame.QUIT:
             running = False
 
@@ -1,59 +1,127 @@
-import pyttsx3
 import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
 # Folder to save generated .wav files
 OUTPUT_FOLDER = "speech"
-os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-
-# List of texts you want to generate as speech files
-phrases = [
-    # Menu phrases
-    "Welcome to the Games Portal",
-    "Please select a game",
-    "Press 1 for Audio Memory Tiles",
-    "Press 2 for Daily Routine Adventure",
-    "Press Escape to quit",
-    "Invalid selection",
-
-    # Memory Game phrases
-    "Welcome to Audio Memory Tiles",
-    "Use 1 to 4, Q to R, etc.",
-    "It's a match!",
-    "Try again",
-    "Score",
-    "of",
-    "You won!",
-    "You lost!",
-    "Press space to replay",
-    "Let's begin",
-    "Congratulations! You found all the pairs. You win!",
-    "Your first choice was a",
-    "That tile is already matched. Try another.",
-    "You picked the same tile again. Choose a different one.",
-    "Press I at any time to hear the current score",
-    "Press the Spacebar to stop the current sound",
-    "Goodbye"
-]
-
-# Keys and numbers for the memory game
-tile_keys = [str(i) for i in range(1, 10)] + ["Q", "W", "E", "R", "A", "S", "D", "F", "Z", "X", "C", "V"]
-
-# Combine all text
-all_phrases = phrases + tile_keys
-
-# Initialize pyttsx3
-engine = pyttsx3.init(driverName='sapi5')
-engine.setProperty('rate', 170)
-
-def sanitize(text):
-    """Sanitizes text to create a valid filename."""
-    return text.lower().replace(" ", "").replace(":", "").replace("!", "").replace("'", "").replace(".", "")
-
-for phrase in all_phrases:
-    filename = sanitize(phrase) + ".wav"
-    filepath = os.path.join(OUTPUT_FOLDER, filename)
-    print(f"Generating: {filepath}")
-    engine.save_to_file(phrase, filepath)
-
-engine.runAndWait()
-print(f"✅ All speech files generated in '{OUTPUT_FOLDER}' folder.")
+MANIFEST_NAME = "manifest.json"
+DEFAULT_RATE = 170
+
+# Every phrase the games speak comes from the compiled phrase table,
+# which build_phrase_registry.py collects from the source
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from engine.phrase_table import PHRASE_IDS, ASSET_KEYS
+
+# --- TTS backends ---
+# Each backend writes one phrase to one .wav file. Workers keep their pyttsx3
+# engine between phrases, since creating one is the slow part.
+_engine = None
+
+def synthesize_pyttsx3(driver, phrase, path, voice, rate):
+    global _engine
+    import pyttsx3
+    if _engine is None:
+        _engine = pyttsx3.init(driverName=driver)
+    _engine.setProperty('rate', rate)
+    if voice:
+        _engine.setProperty('voice', voice)
+    _engine.save_to_file(phrase, path)
+    _engine.runAndWait()
+
+def synthesize_espeak_ng(driver, phrase, path, voice, rate):
+    command = ["espeak-ng", "-w", path, "-s", str(rate)]
+    if voice:
+        command += ["-v", voice]
+    subprocess.run(command + [phrase], check=True, capture_output=True)
+
+BACKENDS = {
+    "sapi5": (synthesize_pyttsx3, "sapi5"),     # Windows
+    "nsss": (synthesize_pyttsx3, "nsss"),       # macOS
+    "espeak": (synthesize_pyttsx3, "espeak"),   # Linux, offline, through pyttsx3
+    "espeak-ng": (synthesize_espeak_ng, None),  # Linux, offline, no Python TTS needed
+}
+
+def default_backend():
+    if sys.platform == "win32":
+        return "sapi5"
+    if sys.platform == "darwin":
+        return "nsss"
+    return "espeak"
+
+def synthesize(job):
+    backend, phrase, path, voice, rate = job
+    function, driver = BACKENDS[backend]
+    function(driver, phrase, path, voice, rate)
+    return path
+
+# --- Incremental build ---
+def phrase_hash(phrase, backend, voice, rate):
+    return hashlib.sha1(json.dumps([phrase, backend, voice, rate]).encode("utf-8")).hexdigest()
+
+def load_manifest(folder):
+    path = os.path.join(folder, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_manifest(folder, manifest):
+    with open(os.path.join(folder, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the speech clips used by the launcher and games.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=default_backend())
+    parser.add_argument("--voice", default=None, help="Backend-specific voice id")
+    parser.add_argument("--rate", type=int, default=DEFAULT_RATE)
+    parser.add_argument("--output", default=OUTPUT_FOLDER)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--force", action="store_true", help="Regenerate every phrase")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    manifest = {} if args.force else load_manifest(args.output)
+
+    jobs = []
+    new_manifest = {}
+    phrases = {}
+    for phrase, phrase_id in PHRASE_IDS.items():
+        phrases.setdefault(ASSET_KEYS[phrase_id], phrase)
+    for key, phrase in phrases.items():
+        filename = key + ".wav"
+        filepath = os.path.join(args.output, filename)
+        digest = phrase_hash(phrase, args.backend, args.voice, args.rate)
+        new_manifest[filename] = {"text": phrase, "hash": digest}
+        if manifest.get(filename, {}).get("hash") != digest or not os.path.exists(filepath):
+            jobs.append((args.backend, phrase, filepath, args.voice, args.rate))
+
+    stale = sorted(set(manifest) - set(new_manifest))
+    print(f"--- {len(jobs)} of {len(phrases)} phrases need generating with '{args.backend}' ---")
+    start = time.perf_counter()
+    failed = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as pool:
+            futures = [(job, pool.submit(synthesize, job)) for job in jobs]
+            for job, future in futures:
+                try:
+                    print(f"Generating: {future.result()}")
+                except Exception as e:
+                    failed += 1
+                    print(f"  - Error generating '{job[1]}': {e}")
+                    # Leave it out of the manifest so the next run retries it
+                    new_manifest.pop(os.path.basename(job[2]), None)
+    save_manifest(args.output, new_manifest)
+    for filename in stale:
+        print(f"  - Note: '{filename}' is no longer in the phrase list")
+    if failed:
+        print(f"{failed} phrases failed; see errors above.")
+    else:
+        print(f"✅ All speech files up to date in '{args.output}' folder ({time.perf_counter() - start:.1f}s).")
+
+if __name__ == "__main__":
+    main()
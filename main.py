@@ -1,164 +1,238 @@
+import time
+IMPORT_STARTED = time.perf_counter()
 import pygame
 import os
-import time
-import queue
 import sys
 
 # Add the project's root directory to the Python path
 # This ensures that subfolders like 'memory_tiles' and 'game2' are found.
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Imports for the games themselves are moved into the main loop
-# to prevent loading them until they are selected.
+# Games are listed from their registry metadata; their code is only imported
+# by their background warm-up or when they are selected.
+from engine.game_registry import load_registry
+from engine.speech_store import SpeechStore
+from engine.audio_pack import get_pack
+from engine.phrases import asset_key
+from engine.audio_bus import get_bus
+from engine import telemetry
+from engine.scene import Engine, Scene
+from engine.startup import StartupCache, StartupProfiler
+from game2 import model_cache, recognition_worker
 
 # --- Constants ---
 WIDTH, HEIGHT = 800, 600
 COLOR_BG = (20, 20, 40)
 COLOR_TITLE = (255, 255, 255)
 COLOR_TEXT = (200, 200, 220)
-
-def sanitize_filename(text):
-    return text.lower().replace(" ", "").replace(":", "").replace("!", "").replace("'", "")
+COLOR_STATUS = (150, 150, 180)
+# Where the Daily Routine speech model is loaded: this process, or the recognition worker
+speech_model = recognition_worker if recognition_worker.ENABLED else model_cache
+MODEL_STATUS_TEXT = {
+    model_cache.LOADING: "Loading speech model...",
+    model_cache.READY: "Ready",
+    model_cache.FAILED: "Speech model unavailable",
+}
+# Posted from the model loading thread so the idle menu wakes up to redraw its status
+MODEL_STATUS_EVENT = pygame.event.custom_type()
+GAMES = load_registry()
+MENU_PHRASES = (["Welcome to the Games Portal", "Please select a game"]
+                + [game.menu_phrase for game in GAMES] + ["Press Escape to quit"])
 
 def load_speech_files():
-    """Loads all pre-generated speech files from the 'speech' folder."""
-    speech = {}
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    speech_dir = os.path.join(script_dir, "speech")
-    print(f"--- Loading All Speech from 'speech' ---")
-    if not os.path.isdir(speech_dir):
-        print("FATAL: 'speech' directory not found. Please run generate_speech.py first.")
-        return None
-    for filename in os.listdir(speech_dir):
-        if filename.endswith(".wav") or filename.endswith(".mp3"):
-            key = os.path.splitext(filename)[0]
-            try:
-                speech[key] = pygame.mixer.Sound(os.path.join(speech_dir, filename))
-            except pygame.error as e:
-                print(f"  - Error loading speech '{filename}': {e}")
+    """Indexes the pre-generated speech, from assets.pack if it was built, else the 'speech' folder.
+    Clips are loaded on first use; the menu announcements are pre-warmed in the background."""
+    pack = get_pack()
+    if pack is not None:
+        print(f"--- Indexing Speech from '{os.path.basename(pack.path)}' ---")
+        speech = SpeechStore.from_pack(pack, "speech")
+    else:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        speech_dir = os.path.join(script_dir, "speech")
+        print(f"--- Indexing Speech from 'speech' ---")
+        if not os.path.isdir(speech_dir):
+            print("FATAL: 'speech' directory not found. Please run generate_speech.py first.")
+            return None
+        speech = SpeechStore.from_folder(speech_dir)
+    speech.prewarm([asset_key(text) for text in MENU_PHRASES])
+    print(f"  - Indexed {len(speech)} phrases")
     print("------------------------------------")
     return speech
 
+def render_menu_layout(title_font, option_font, logo_surf):
+    """Renders the static parts of the menu once. Returns a list of (surface, position)."""
+    layout = []
+    if logo_surf:
+        layout.append((logo_surf, logo_surf.get_rect(center=(WIDTH / 2, 100)).topleft))
+        title_y, option1_y = 200, 320
+    else:
+        title_y, option1_y = 100, 250
+    # One line per game, closer together when there are many
+    step = min(100, (HEIGHT - 80 - option1_y) // max(1, len(GAMES)))
+    lines = [("Game Launcher", title_font, COLOR_TITLE, title_y)]
+    lines += [(game.menu_label, option_font, COLOR_TEXT, option1_y + i * step) for i, game in enumerate(GAMES)]
+    for text, font, color, y in lines:
+        surf = font.render(text, True, color)
+        layout.append((surf, (WIDTH/2 - surf.get_width()/2, y)))
+    return layout, lines[-1][3] + 60
+
+def draw_menu(screen, layout, status_surf, status_y):
+    screen.fill(COLOR_BG)
+    for surf, pos in layout:
+        screen.blit(surf, pos)
+    screen.blit(status_surf, (WIDTH/2 - status_surf.get_width()/2, status_y))
+    pygame.display.flip()
+
+class LauncherMenu(Scene):
+    """The game launcher's menu: the engine's home scene, which the games return to."""
+    name = "menu"
+    # The menu only redraws when something changes, so it sleeps between events
+    fps = None
+
+    def __init__(self, screen, speech_sounds, layout, status_surfs, status_y):
+        super().__init__()
+        self.screen = screen
+        self.speech_sounds = speech_sounds
+        self.layout = layout
+        self.status_surfs = status_surfs
+        self.status_y = status_y
+        self.audio = get_bus()
+        self.games_by_key = {pygame.K_0 + game.number: game for game in GAMES}
+        self.needs_redraw = True
+        # Whether the choices were read out since the menu last came on screen
+        self.announced = False
+
+    def say(self, text):
+        sound = self.speech_sounds.phrase(text)
+        if sound is not None:
+            self.audio.enqueue("speech", sound)
+        else:
+            print(f"Menu Warning: No speech for phrase: '{text}'")
+
+    def announce_games(self):
+        """Reads out the choices. Each game starts warming up in the background as it is announced."""
+        self.say("Please select a game")
+        for game in GAMES:
+            self.say(game.menu_phrase)
+            game.warm_up(self.speech_sounds)
+        self.say("Press Escape to quit")
+        self.announced = True
+
+    # --- Scene hooks ---
+    def enter(self):
+        # Coming back from a game; the first time, main() has already drawn and announced
+        if not self.announced:
+            self.needs_redraw = True
+            self.announce_games()
+
+    def handle_event(self, event):
+        if event.type in (MODEL_STATUS_EVENT, pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED):
+            self.needs_redraw = True
+        if event.type == pygame.QUIT:
+            self.finish()
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.finish()
+        game = self.games_by_key.get(event.key)
+        if game is None:
+            return
+        reason = game.unavailable()
+        if reason is not None:
+            self.say(reason)
+            return
+        print(f"Starting {game.label}...")
+        try:
+            scene = game.create(self.screen, self.speech_sounds)
+        except (ImportError, FileNotFoundError, ValueError) as e:
+            print(f"Could not start {game.label}. Error: {e}")
+            self.say(game.error_phrase)
+            return
+        # The window, mixer, fonts and loaded speech all carry over to the game
+        self.engine.switch(scene)
+
+    def render(self, screen):
+        # Only when something on screen changed
+        if self.needs_redraw:
+            draw_menu(screen, self.layout, self.status_surfs[speech_model.status()], self.status_y)
+            self.needs_redraw = False
+
+    def exit(self):
+        self.announced = False
+
 def main():
     """Main function to run the game launcher menu."""
+    profiler = StartupProfiler(IMPORT_STARTED)
+    profiler.phase("imports")
+    if "--telemetry" in sys.argv[1:]:
+        telemetry.enable()
+    # --- Staged startup ---
+    # Only what the first frame and the first announcement need happens before
+    # them; pygame.init() (joysticks and the rest) and the speech model wait.
     pygame.mixer.pre_init(44100, -16, 2, 512)
-    pygame.init()
-    pygame.mixer.set_num_channels(2) # 0 for effects, 1 for speech
-    speech_channel = pygame.mixer.Channel(1)
+    pygame.display.init()
+    pygame.font.init()
+    pygame.mixer.init()
+    audio = get_bus()
+    profiler.phase("display, font, mixer init")
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Game Launcher")
-    title_font = pygame.font.SysFont("helvetica", 72)
-    option_font = pygame.font.SysFont("helvetica", 48)
-    clock = pygame.time.Clock()
+    profiler.phase("window")
+    cache = StartupCache()
+    title_font = cache.font("helvetica", 72)
+    option_font = cache.font("helvetica", 48)
+    status_font = cache.font("helvetica", 28)
+    profiler.phase("fonts")
 
     speech_sounds = load_speech_files()
     if not speech_sounds:
         return # Exit if speech files are missing
+    profiler.phase("speech index")
 
     # --- Load Logo ---
     logo_surf = None
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         logo_path = os.path.join(script_dir, "logo", "logo.jpg")
-        logo_img = pygame.image.load(logo_path)
-        # Resize the logo to a reasonable size
-        logo_surf = pygame.transform.scale(logo_img, (150, 150))
-    except pygame.error as e:
+        # Resized to a reasonable size once, then read back already scaled
+        logo_surf = cache.scaled_image(logo_path, (150, 150))
+    except (pygame.error, FileNotFoundError) as e:
         print(f"Warning: Could not load logo.jpg from 'logo' folder: {e}")
+    profiler.phase("logo")
 
-    speech_queue = queue.Queue()
+    layout, status_y = render_menu_layout(title_font, option_font, logo_surf)
+    status_surfs = {state: status_font.render(text, True, COLOR_STATUS) for state, text in MODEL_STATUS_TEXT.items()}
+    status_surfs[model_cache.IDLE] = status_font.render("", True, COLOR_STATUS)
+    profiler.phase("menu layout")
+    draw_menu(screen, layout, status_surfs[speech_model.status()], status_y)
+    profiler.milestone("first frame")
 
-    def say(text):
-        sanitized_key = sanitize_filename(text)
-        if sanitized_key in speech_sounds:
-            speech_queue.put(speech_sounds[sanitized_key])
-        else:
-            print(f"Menu Warning: Speech sound not found for key: '{sanitized_key}'")
+    menu = LauncherMenu(screen, speech_sounds, layout, status_surfs, status_y)
+    menu.needs_redraw = False
 
     # --- Announce Menu ---
-    say("Welcome to the Games Portal")
-    say("Please select a game")
-    say("Press 1 for Audio Memory Tiles")
-    say("Press 2 for Daily Routine Adventure")
-    say("Press Escape to quit")
-
-    running = True
-    while running:
-        # --- Speech Playback ---
-        if not speech_channel.get_busy() and not speech_queue.empty():
-            speech_channel.play(speech_queue.get())
-
-        # --- Event Handling ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                if event.key == pygame.K_1:
-                    print("Starting Memory Game...")
-                    try:
-                        from memory_tiles.memory_tiles import MemoryGame
-                        game = MemoryGame(screen, speech_sounds)
-                        game.run()
-                    except ImportError as e:
-                        print(f"Could not start Memory Game. Error: {e}")
-                        say("Error starting game.")
-                    
-                    # After game finishes, re-announce menu
-                    say("Please select a game")
-                    say("Press 1 for Audio Memory Tiles")
-                    say("Press 2 for Daily Routine Adventure")
-                    say("Press Escape to quit")
-
-                if event.key == pygame.K_2:
-                    print("Starting Daily Routine Game...")
-                    try:
-                        from game2.daily_routine_game import DailyRoutineGame
-                        game = DailyRoutineGame(screen)
-                        game.run()
-                    except (ImportError, FileNotFoundError) as e:
-                        print(f"Could not start Daily Routine Game. Error: {e}")
-                        say("Error starting game. Please check model files and dependencies.")
-                    
-                    # After game finishes, re-announce menu
-                    say("Please select a game")
-                    say("Press 1 for Audio Memory Tiles")
-                    say("Press 2 for Daily Routine Adventure")
-                    say("Press Escape to quit")
-
-        # --- Drawing ---
-        screen.fill(COLOR_BG)
-        
-        # Blit the logo if it was loaded successfully
-        if logo_surf:
-            logo_rect = logo_surf.get_rect(center=(WIDTH / 2, 100))
-            screen.blit(logo_surf, logo_rect)
-            # Adjust title position to be below the logo
-            title_surf = title_font.render("Game Launcher", True, COLOR_TITLE)
-            screen.blit(title_surf, (WIDTH/2 - title_surf.get_width()/2, 200))
-            
-            # Adjust option positions
-            option1_y = 320
-            option2_y = 420
-        else:
-            # If no logo, draw title at original position
-            title_surf = title_font.render("Game Launcher", True, COLOR_TITLE)
-            screen.blit(title_surf, (WIDTH/2 - title_surf.get_width()/2, 100))
-            # Original option positions
-            option1_y = 250
-            option2_y = 350
-
-        option1_surf = option_font.render("1: Audio Memory Tiles", True, COLOR_TEXT)
-        screen.blit(option1_surf, (WIDTH/2 - option1_surf.get_width()/2, option1_y))
-        
-        option2_surf = option_font.render("2: Daily Routine Adventure", True, COLOR_TEXT)
-        screen.blit(option2_surf, (WIDTH/2 - option2_surf.get_width()/2, option2_y))
-
-        pygame.display.flip()
-        clock.tick(30)
+    # The Daily Routine warm-up starts loading the speech model; the status line follows it
+    speech_model.add_listener(lambda: pygame.event.post(pygame.event.Event(MODEL_STATUS_EVENT)))
+    menu.say("Welcome to the Games Portal")
+    menu.announce_games()
+    profiler.milestone("first announcement")
 
+    # --- Deferred startup ---
+    pygame.init()
+    profiler.phase("remaining pygame init")
+    cache.save()
+    profiler.phase("startup cache save")
+    if "--profile-startup" in sys.argv[1:]:
+        profiler.report()
+        pygame.quit()
+        return
+
+    # One loop for the menu and every game; pygame is only shut down once it ends
+    engine = Engine(screen)
+    engine.run(menu)
+    if engine.switch_ms:
+        print("Scene switches: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in engine.switch_ms))
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+import random
+from array import array
+
+# Tile states, one byte per tile
+HIDDEN, REVEALED, MATCHED = 0, 1, 2
+
+class Board:
+    """
+    Memory Tiles board state for any grid size. Each tile holds its pair
+    number in an unsigned-short array and its state in a bytearray, so a
+    144-tile board is a few hundred bytes and a match check is one integer
+    comparison. Every state change records the tile in `dirty`, letting
+    the renderer redraw only what changed.
+    """
+    def __init__(self, rows, cols, rng=random):
+        if rows * cols % 2:
+            raise ValueError(f"A {rows}x{cols} board has an odd number of tiles")
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.pair_count = self.size // 2
+        pairs = list(range(self.pair_count)) * 2
+        rng.shuffle(pairs)
+        self.pairs = array("H", pairs)
+        self.state = bytearray(self.size)
+        self.found = 0
+        self.dirty = set(range(self.size))
+
+    def set_state(self, index, state):
+        if self.state[index] != state:
+            self.state[index] = state
+            self.dirty.add(index)
+
+    def is_match(self, first, second):
+        return self.pairs[first] == self.pairs[second]
+
+    def mark_matched(self, first, second):
+        self.set_state(first, MATCHED)
+        self.set_state(second, MATCHED)
+        self.found += 1
+
+    @property
+    def complete(self):
+        return self.found == self.pair_count
+
+    def take_dirty(self):
+        """Tiles changed since the last call."""
+        dirty, self.dirty = self.dirty, set()
+        return dirty
@@ -0,0 +1,33 @@
+# Launcher metadata for Audio Memory Tiles (see engine/game_registry.py).
+# Game code is only imported by warm_up() and create().
+LABEL = "Audio Memory Tiles"
+PHRASES = [
+    "Welcome to Audio Memory Tiles",
+    "Use 1 to 4, Q to R, A to  F, etc.",
+    "Let's begin",
+    "Press I at any time to hear the current score",
+]
+ERROR_PHRASE = "Error starting game."
+
+# Tile sounds indexed and loaded by the last warm-up, handed to the next game created
+_sound_pool = None
+
+def warm_up(speech):
+    global _sound_pool
+    # Importing the game module is most of its start-up cost
+    from memory_tiles.memory_tiles import DEFAULT_COLS, DEFAULT_ROWS
+    from memory_tiles.sound_pool import SoundPool
+    # Indexes the tile recordings (opening the audio pack) and loads the ones the first board uses
+    sound_pool = SoundPool.from_assets()
+    sound_pool.assign(DEFAULT_ROWS * DEFAULT_COLS // 2)
+    sound_pool.preload()
+    _sound_pool = sound_pool
+
+def unavailable():
+    return None
+
+def create(screen, speech):
+    global _sound_pool
+    from memory_tiles.memory_tiles import MemoryGame
+    sound_pool, _sound_pool = _sound_pool, None
+    return MemoryGame(screen, speech, sound_pool=sound_pool)
@@ -0,0 +1,45 @@
+import pygame
+
+# Single-key boards follow the keyboard's shape: tile (row, col) is
+# KEYBOARD_ROWS[row][col], so the classic 4x4 board is 1-4, Q-R, A-F, Z-V.
+# I reads out the score, so it is never a tile key.
+KEYBOARD_ROWS = ["1234567890", "QWERTYUOP", "ASDFGHJKL", "ZXCVBNM"]
+# Boards too big for that are addressed with two keys: row, then column
+STROKE_KEYS = "1234567890QWERTYUOPASDFGHJKLZXCVBNM"
+
+class KeyLayout:
+    """
+    Generated key scheme for a rows x cols board. `labels[i]` is what the
+    player types to pick tile i: one key on boards that fit the keyboard
+    rows, otherwise a row key followed by a column key.
+    """
+    def __init__(self, rows, cols):
+        if rows <= len(KEYBOARD_ROWS) and all(cols <= len(keys) for keys in KEYBOARD_ROWS[:rows]):
+            self.strokes = 1
+            self.labels = [KEYBOARD_ROWS[row][col] for row in range(rows) for col in range(cols)]
+            self.first_keys = set(self.labels)
+        elif rows <= len(STROKE_KEYS) and cols <= len(STROKE_KEYS):
+            self.strokes = 2
+            self.labels = [STROKE_KEYS[row] + STROKE_KEYS[col] for row in range(rows) for col in range(cols)]
+            self.first_keys = set(STROKE_KEYS[:rows])
+        else:
+            raise ValueError(f"No key layout for a {rows}x{cols} board")
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        # Characters this board's labels use; other keys are ignored
+        self.chars = set("".join(self.labels))
+
+    def key_char(self, key):
+        """The layout character for a pygame key, or None if it is not a key of this board."""
+        name = pygame.key.name(key).upper()
+        return name if len(name) == 1 and name in self.chars else None
+
+    def feed(self, typed, char):
+        """
+        Adds one key to what has been typed so far. Returns (tile index or
+        None, what is still typed): the index once a full label is typed, and
+        an empty string whenever the keys cannot lead to a tile.
+        """
+        typed += char
+        if len(typed) < self.strokes:
+            return None, typed if typed in self.first_keys else ""
+        return self.index.get(typed), ""
@@ -1,209 +1,235 @@
 import pygame
-import random
-import time
-import os
-import queue
+from itertools import chain
+from engine.audio_bus import get_bus
+from engine.compositor import UtteranceCompositor
+from memory_tiles.board import Board, HIDDEN, REVEALED, MATCHED
+from memory_tiles.key_layout import KeyLayout
+from memory_tiles.sound_pool import SoundPool
+from engine.scene import Scene
 
 # --- Game Constants ---
-SOUND_PAIRS = [
-    "Cat", "Dog", "Bird", "Cow",
-    "Car", "Bell", "Drum", "Duck"
-]
-GRID_SIZE = 4
-TILE_COUNT = GRID_SIZE * GRID_SIZE
+# The board the launcher plays. Larger boards are only built by
+# benchmarks/bench_memory_tiles.py: there are no speech clips for their
+# key names, their scores above 9 or their two-key instructions.
+DEFAULT_ROWS, DEFAULT_COLS = 4, 4
+# Largest tile and gap; bigger boards shrink both to fit the window
 TILE_SIZE = 120
 MARGIN = 20
-WINDOW_WIDTH = (TILE_SIZE + MARGIN) * GRID_SIZE + MARGIN
-WINDOW_HEIGHT = (TILE_SIZE + MARGIN) * GRID_SIZE + MARGIN
+FONT_SIZE = 36
 COLOR_BG = (30, 30, 30)
 COLOR_HIDDEN = (70, 70, 70)
 COLOR_REVEALED = (255, 215, 0)
 COLOR_MATCHED = (60, 179, 113)
 COLOR_TEXT = (255, 255, 255)
-KEY_MAP = {
-    pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2, pygame.K_4: 3,
-    pygame.K_q: 4, pygame.K_w: 5, pygame.K_e: 6, pygame.K_r: 7,
-    pygame.K_a: 8, pygame.K_s: 9, pygame.K_d: 10, pygame.K_f: 11,
-    pygame.K_z: 12, pygame.K_x: 13, pygame.K_c: 14, pygame.K_v: 15,
-}
+TILE_COLORS = {HIDDEN: COLOR_HIDDEN, REVEALED: COLOR_REVEALED, MATCHED: COLOR_MATCHED}
 
 # --- Main Game Class ---
-class MemoryGame:
+class MemoryGame(Scene):
+    name = "memory_tiles"
+
     # The __init__ method is updated to accept the screen and speech_sounds from the main menu
-    def __init__(self, screen, speech_sounds):
+    def __init__(self, screen, speech_sounds, rows=DEFAULT_ROWS, cols=DEFAULT_COLS, sound_pool=None):
+        super().__init__()
         # Use the screen and sounds passed from the main menu
         self.screen = screen
         self.speech_sounds = speech_sounds
+        self.rows, self.cols = rows, cols
+        self.layout = KeyLayout(rows, cols)
+
+        # Tiles shrink to fit bigger boards in the launcher's window
+        width, height = screen.get_size()
+        self.margin = max(4, MARGIN * DEFAULT_COLS // max(rows, cols))
+        self.tile_size = min(TILE_SIZE, (width - self.margin) // cols - self.margin,
+                             (height - self.margin) // rows - self.margin)
         
         # Game-specific setup
-        self.font = pygame.font.Font(None, 36)
-        self.clock = pygame.time.Clock()
-        self.effects_channel = pygame.mixer.Channel(0)
-        self.speech_channel = pygame.mixer.Channel(1)
-        self.speech_queue = queue.Queue()
+        self.font = pygame.font.Font(None, max(14, FONT_SIZE * self.tile_size // TILE_SIZE))
+        # Pre-rendered tiles keyed by (state, label); label is None for hidden tiles
+        self.tile_surfaces = {}
+        self.audio = get_bus()
         
-        # Load game-specific sounds
-        self.sounds = self.load_sounds("sounds", SOUND_PAIRS)
+        # Only the recordings this board's pairs use are loaded. The launcher's
+        # warm-up hands over a pool that already has them.
+        self.sound_pool = sound_pool if sound_pool is not None else SoundPool.from_assets()
+        self.pair_count = rows * cols // 2
+        self.labels = self.sound_pool.assign(self.pair_count)
+
+        # Build the common compound announcements while the intro plays. The
+        # recordings behind "Your first choice was a ..." are loaded on that thread too.
+        self.compositor = UtteranceCompositor(speech_sounds)
+        self.compositor.prebuild(chain(
+            [("Score", str(n), "of", str(self.pair_count)) for n in range(self.pair_count + 1)],
+            (("Your first choice was a", self.sound_pool.sound(pair))
+             for pair, (_, variant) in enumerate(self.sound_pool.pairs) if variant == 0)))
         self.reset_game_state()
 
     def reset_game_state(self):
         """Initializes or resets the state of the game."""
-        self.tiles = (SOUND_PAIRS * 2)
-        random.shuffle(self.tiles)
-        self.revealed_state = ['hidden'] * TILE_COUNT
+        self.board = Board(self.rows, self.cols)
         self.first_selection = None
         self.second_selection = None
         self.running = True
-        self.found_pairs = 0
         self.is_checking_match = False
         self.timer_start_time = 0
         self.pending_selection_index = None
-
-    def load_sounds(self, folder, sound_names):
-        sounds = {}
-        # The path is now relative to the main script's location
-        script_dir = os.path.dirname(os.path.abspath(os.path.join(__file__, "..")))
-        sounds_dir = os.path.join(script_dir, "memory_tiles", folder)
-        
-        print(f"--- Loading Sounds from '{folder}' ---")
-        print(f"Looking in: {sounds_dir}")
-
-        if not os.path.isdir(sounds_dir):
-            print(f"Warning: '{folder}' directory not found.")
-            return sounds
-
-        for name in sound_names:
-            path = os.path.join(sounds_dir, f"{name}.wav")
-            if not os.path.exists(path):
-                path = os.path.join(sounds_dir, f"{name}.mp3")
-            
-            if os.path.exists(path):
-                try:
-                    sounds[name] = pygame.mixer.Sound(path)
-                    print(f"  - Loaded {name}")
-                except pygame.error as e:
-                    print(f"  - Error loading {name}: {e}")
-            else:
-                print(f"  - Warning: Sound file not found for {name}")
-        print("-----------------------------")
-        return sounds
-
-    def sanitize_filename(self, text):
-        return text.lower().replace(" ", "").replace(":", "").replace("!", "").replace("'", "")
+        # Keys typed so far towards a multi-key tile label
+        self.typed = ""
+        self.board_drawn = False
 
     def say(self, text):
-        sanitized_key = self.sanitize_filename(text)
-        if sanitized_key in self.speech_sounds:
-            self.speech_queue.put(self.speech_sounds[sanitized_key])
+        sound = self.speech_sounds.phrase(text)
+        if sound is not None:
+            self.audio.enqueue("speech", sound)
         else:
-            print(f"Warning: Speech sound not found for key: '{sanitized_key}'")
+            print(f"Warning: No speech for phrase: '{text}'")
+
+    def say_parts(self, *parts):
+        """Speaks phrases and tile sounds as one gapless clip, or one by one without NumPy."""
+        sound = self.compositor.compose(parts)
+        if sound is not None:
+            self.audio.enqueue("speech", sound)
+            return
+        for part in parts:
+            if isinstance(part, str): self.say(part)
+            else: self.audio.play("effects", part, maxtime=3000)
 
     def stop_all_sounds(self):
-        self.effects_channel.stop()
-        self.speech_channel.stop()
-        with self.speech_queue.mutex:
-            self.speech_queue.queue.clear()
+        self.audio.stop("effects")
+        self.audio.stop("speech")
 
     def introduce_game(self):
         self.draw_board()
         self.say("Welcome to Audio Memory Tiles")
-        self.say("Use 1 to 4, Q to R, A to  F, etc.")
+        if self.layout.strokes == 1:
+            self.say("Use 1 to 4, Q to R, A to  F, etc.")
         self.say("Let's begin")
         
         self.say("Press I at any time to hear the current score")
         self.say("Press the Spacebar to stop the current sound")
-        self.say("Press Escape at any time to quit")
+        self.say("Press Escape to quit")
+
+    def tile_rect(self, i):
+        row, col = divmod(i, self.cols)
+        step = self.tile_size + self.margin
+        return pygame.Rect(self.margin + col * step, self.margin + row * step, self.tile_size, self.tile_size)
+
+    def tile_surface(self, key):
+        if key not in self.tile_surfaces:
+            state, label = key
+            surf = pygame.Surface((self.tile_size, self.tile_size))
+            surf.fill(COLOR_BG)
+            rect = surf.get_rect()
+            pygame.draw.rect(surf, TILE_COLORS[state], rect, border_radius=10)
+            if label is not None:
+                text_surf = self.font.render(label, True, COLOR_TEXT)
+                surf.blit(text_surf, text_surf.get_rect(center=rect.center))
+            self.tile_surfaces[key] = surf
+        return self.tile_surfaces[key]
 
     def draw_board(self):
-        self.screen.fill(COLOR_BG)
-        for i in range(TILE_COUNT):
-            row, col = i // GRID_SIZE, i % GRID_SIZE
-            x, y = MARGIN + col * (TILE_SIZE + MARGIN), MARGIN + row * (TILE_SIZE + MARGIN)
-            rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-            color = COLOR_HIDDEN
-            if self.revealed_state[i] == 'revealed': color = COLOR_REVEALED
-            elif self.revealed_state[i] == 'matched': color = COLOR_MATCHED
-            pygame.draw.rect(self.screen, color, rect, border_radius=10)
-            if self.revealed_state[i] != 'hidden':
-                text_surf = self.font.render(self.tiles[i], True, COLOR_TEXT)
-                text_rect = text_surf.get_rect(center=rect.center)
-                self.screen.blit(text_surf, text_rect)
-        pygame.display.flip()
+        """Redraws only the tiles whose state changed since the last call."""
+        dirty = []
+        if not self.board_drawn:
+            # The launcher's menu is still on screen the first time
+            self.screen.fill(COLOR_BG)
+            dirty.append(self.screen.get_rect())
+            self.board.dirty.update(range(self.board.size))
+            self.board_drawn = True
+        for i in self.board.take_dirty():
+            state = self.board.state[i]
+            key = (state, None if state == HIDDEN else self.labels[self.board.pairs[i]])
+            rect = self.tile_rect(i)
+            self.screen.blit(self.tile_surface(key), rect)
+            dirty.append(rect)
+        if dirty:
+            pygame.display.update(dirty)
 
     def handle_input(self, event):
         if event.key == pygame.K_i:
             self.stop_all_sounds()
-            self.say("Score"); self.say(str(self.found_pairs)); self.say("of"); self.say(str(len(SOUND_PAIRS)))
+            self.say_parts("Score", str(self.board.found), "of", str(self.pair_count))
             return
-        if event.key in KEY_MAP:
-            index = KEY_MAP[event.key]
+        char = self.layout.key_char(event.key)
+        if char is not None:
             self.stop_all_sounds()
-            self.say(pygame.key.name(event.key).upper())
-            if self.revealed_state[index] == 'matched':
+            self.say(char)
+            index, self.typed = self.layout.feed(self.typed, char)
+            if index is None:
+                return # Waiting for the column key, or the keys name no tile
+            if self.board.state[index] == MATCHED:
                 self.say("That tile is already matched. Try another.")
                 if self.first_selection:
-                    self.say("Your first choice was a")
-                    self.effects_channel.play(self.sounds[self.first_selection[1]], maxtime=3000)
+                    first_sound = self.sound_pool.sound(self.first_selection[1])
+                    if first_sound is not None:
+                        self.say_parts("Your first choice was a", first_sound)
                 return
             if self.first_selection and self.first_selection[0] == index:
                 self.say("You picked the same tile again. Choose a different one.")
                 return
+            # The tile's sound plays once the key name has been spoken
             self.pending_selection_index = index
+            self.audio.when_idle("speech", self.process_pending_selection)
+
+    def process_pending_selection(self):
+        if self.pending_selection_index is not None:
+            index, self.pending_selection_index = self.pending_selection_index, None
+            self.process_selection(index)
 
     def process_selection(self, index):
-        sound_name = self.tiles[index]
-        self.revealed_state[index] = 'revealed'
+        pair = self.board.pairs[index]
+        self.board.set_state(index, REVEALED)
         self.draw_board()
-        if sound_name in self.sounds:
-            self.effects_channel.play(self.sounds[sound_name], maxtime=3000)
-        else: self.say(f"Sound for {sound_name} not found.")
-        if self.first_selection is None: self.first_selection = (index, sound_name)
-        else: self.second_selection = (index, sound_name); self.check_for_match()
+        sound = self.sound_pool.sound(pair)
+        if sound is not None:
+            self.audio.play("effects", sound, maxtime=3000)
+        else: self.say(f"Sound for {self.labels[pair]} not found.")
+        if self.first_selection is None: self.first_selection = (index, pair)
+        else: self.second_selection = (index, pair); self.check_for_match()
 
     def check_for_match(self):
         self.is_checking_match = True
         self.timer_start_time = pygame.time.get_ticks()
 
     def resolve_match(self):
-        idx1, sound1 = self.first_selection
-        idx2, sound2 = self.second_selection
-        if sound1 == sound2:
+        idx1, _ = self.first_selection
+        idx2, _ = self.second_selection
+        if self.board.is_match(idx1, idx2):
             self.say("It's a match!")
-            self.revealed_state[idx1] = 'matched'
-            self.revealed_state[idx2] = 'matched'
-            self.found_pairs += 1
-            self.say("Score"); self.say(str(self.found_pairs)); self.say("of"); self.say(str(len(SOUND_PAIRS)))
-            if self.found_pairs == len(SOUND_PAIRS):
+            self.board.mark_matched(idx1, idx2)
+            self.say_parts("Score", str(self.board.found), "of", str(self.pair_count))
+            if self.board.complete:
                 self.draw_board()
                 self.say("Congratulations! You found all the pairs. You win!")
                 self.running = False
         else:
             self.say("Try again")
-            self.revealed_state[idx1] = 'hidden'
-            self.revealed_state[idx2] = 'hidden'
+            self.board.set_state(idx1, HIDDEN)
+            self.board.set_state(idx2, HIDDEN)
         self.first_selection, self.second_selection = None, None
         self.is_checking_match = False
 
-    def run(self):
+    # --- Scene hooks ---
+    def enter(self):
         self.reset_game_state()
+        self.stop_all_sounds()
         self.introduce_game()
-        while self.running:
-            if not self.speech_channel.get_busy() and not self.speech_queue.empty():
-                self.speech_channel.play(self.speech_queue.get())
-            if self.pending_selection_index is not None and self.speech_queue.empty() and not self.speech_channel.get_busy():
-                self.process_selection(self.pending_selection_index)
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT: self.finish()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                # Stopping runs the lane's idle callbacks; a tile waiting on its key name must not be revealed
                 self.pending_selection_index = None
-            if self.is_checking_match and not self.effects_channel.get_busy() and not self.speech_channel.get_busy() and pygame.time.get_ticks() - self.timer_start_time >= 1000:
-                self.resolve_match()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: self.running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE: self.running = False; self.stop_all_sounds()
-                    elif event.key == pygame.K_SPACE: self.stop_all_sounds()
-                    elif not self.is_checking_match and self.pending_selection_index is None and self.speech_queue.empty():
-                        self.handle_input(event)
-            self.draw_board()
-            self.clock.tick(30)
-        self.stop_all_sounds()
-        self.say("Returning to main menu.")
-        time.sleep(2)
+                self.finish(); self.stop_all_sounds()
+            elif event.key == pygame.K_SPACE: self.stop_all_sounds(); self.typed = ""
+            elif not self.is_checking_match and self.pending_selection_index is None and not self.audio.pending("speech"):
+                self.handle_input(event)
+
+    def update(self):
+        if self.is_checking_match and not self.audio.busy("effects") and not self.audio.busy("speech") and pygame.time.get_ticks() - self.timer_start_time >= 1000:
+            self.resolve_match()
+        if not self.running:
+            self.finish() # All pairs found
+
+    def render(self, screen):
+        self.draw_board()
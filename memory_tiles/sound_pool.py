@@ -0,0 +1,100 @@
+import os
+import threading
+import pygame
+from engine import telemetry
+from engine.audio_pack import ASSET_GROUPS, AUDIO_EXTENSIONS, ROOT_DIR, get_pack
+
+try:
+    import pygame.sndarray
+    from engine.pcm import pitch_shift
+except ImportError:
+    pitch_shift = None
+
+# Preferred order of the recorded tile sounds; any others found come after
+SOUND_NAMES = ["Cat", "Dog", "Bird", "Cow", "Car", "Bell", "Drum", "Duck"]
+# Pitch offsets (semitones) that turn one recording into further distinct pairs
+VARIANT_STEPS = [0, 5, -5, 9, -9, 12, -12, 16, -16, 19, -19, 24]
+
+class SoundPool:
+    """
+    The tile sounds for one board. Pairs are assigned recordings first and
+    pitch-shifted variants of them once the recordings run out, so boards of
+    any size get distinct pairs. Without NumPy the variants are the
+    recordings themselves, repeated. Only the recordings and variants the
+    board uses are ever loaded; everything else stays on disk.
+    """
+    def __init__(self, sources, load):
+        self.sources = sources
+        self.load = load
+        self._recordings = {}
+        self._sounds = {}
+        self._lock = threading.Lock()
+        self.pairs = []
+
+    @classmethod
+    def from_assets(cls):
+        """Indexes the tile recordings in the audio pack, or in memory_tiles/sounds."""
+        pack = get_pack()
+        if pack is not None:
+            names = pack.names("tiles")
+            sources = {name: f"tiles/{name}" for name in names}
+            load = pack.sound
+        else:
+            folder = os.path.join(ROOT_DIR, ASSET_GROUPS["tiles"])
+            files = os.listdir(folder) if os.path.isdir(folder) else []
+            sources = {os.path.splitext(name)[0]: os.path.join(folder, name)
+                       for name in sorted(files) if name.endswith(AUDIO_EXTENSIONS)}
+            load = pygame.mixer.Sound
+        ordered = [name for name in SOUND_NAMES if name in sources]
+        ordered += [name for name in sorted(sources) if name not in ordered]
+        return cls({name: sources[name] for name in ordered}, load)
+
+    def assign(self, pair_count):
+        """Chooses the (recording, variant) of every pair. Returns their labels."""
+        names = list(self.sources)
+        if not names:
+            raise ValueError("No tile sounds found")
+        variants = -(-pair_count // len(names))
+        if variants > 1 and pitch_shift is None:
+            print(f"Warning: NumPy is not installed, so {pair_count} pairs share {len(names)} tile sounds")
+        elif variants > len(VARIANT_STEPS):
+            raise ValueError(f"Not enough tile sounds for {pair_count} pairs")
+        self.pairs = [(names[pair % len(names)], pair // len(names)) for pair in range(pair_count)]
+        self._sounds = {}
+        return [self.label(pair) for pair in range(pair_count)]
+
+    def preload(self):
+        """Loads the recordings the assigned pairs use, ahead of their first reveal."""
+        with self._lock:
+            for name in {name for name, _ in self.pairs}:
+                self._recording(name)
+
+    def label(self, pair):
+        name, variant = self.pairs[pair]
+        return name if variant == 0 else f"{name} {variant + 1}"
+
+    def sound(self, pair):
+        """The Sound for a pair, loading or deriving it on first use. None if it cannot be loaded."""
+        # Also called from the compositor's prebuild thread
+        with self._lock:
+            if pair not in self._sounds:
+                name, variant = self.pairs[pair]
+                sound = self._recording(name)
+                if sound is not None and variant and pitch_shift is not None:
+                    samples = pitch_shift(pygame.sndarray.array(sound), VARIANT_STEPS[variant])
+                    sound = pygame.sndarray.make_sound(samples)
+                self._sounds[pair] = sound
+            return self._sounds[pair]
+
+    def _recording(self, name):
+        if name not in self._recordings:
+            try:
+                self._recordings[name] = telemetry.timed_load("tile_sound_load_ms", self.load, self.sources[name])
+            except pygame.error as e:
+                print(f"  - Error loading {name}: {e}")
+                self._recordings[name] = None
+        return self._recordings[name]
+
+    def loaded(self):
+        """How many recordings and pair sounds are in memory."""
+        return len([s for s in self._recordings.values() if s is not None]), len(self._sounds)